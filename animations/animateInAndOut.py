@@ -2,7 +2,16 @@
 
 import pygame
 
-def animateTextInAndOut(surface, font, text, initialSize, maxSize, color, center, totalDuration, timeLeft, animationDuration):
+from classes.EffectCache import EffectCache
+
+# Pre-rendered circles, keyed by color, radius and transparency
+circle_cache = EffectCache(maxSize = 128)
+
+# Every animation frame of a text, keyed by font, text, color and sizes
+text_frames_cache = EffectCache(maxSize = 8)
+
+# Returns the text's animation frame for the time left and its rect
+def animateTextInAndOut(font, text, initialSize, maxSize, color, center, totalDuration, timeLeft, animationDuration):
     time_passed = totalDuration - timeLeft
 
     # Calculate current text scale
@@ -21,22 +30,34 @@ def animateTextInAndOut(surface, font, text, initialSize, maxSize, color, center
     # Ensure scale is between 0 and 1
     scale = max(0, min(1, scale))
 
-    # Calculate font size and opacity (alpha value)
+    # Calculate font size
     size = int(initialSize + (maxSize - initialSize) * scale)
-    alpha = int(255 * scale)
 
-    # Render the text
-    text_surface = font.render(text, True, color)
-    text_surface = pygame.transform.scale(text_surface, (size, size))
-    text_surface.set_alpha(alpha)
+    # Get the frame already rendered at that size and opacity
+    frames = text_frames_cache.get((font, text, color, initialSize, maxSize), lambda: renderTextFrames(font, text, color, initialSize, maxSize))
+    text_surface = frames[size - initialSize]
 
     # Get the rect and set the position
     text_rect = text_surface.get_rect(center = center)
 
-    # Display the text
-    surface.blit(text_surface, text_rect)
+    return text_surface, text_rect
+
+def renderTextFrames(font, text, color, initialSize, maxSize):
+    text_surface = font.render(text, True, color)
+    frames = []
 
-def animateCircleInAndOut(surface, colorRGB, center, initialRadius, maxRadius, maxAlpha, totalDuration, timeLeft, animationDuration):
+    # One frame per size, with the opacity that goes with it
+    for size in range(initialSize, maxSize + 1):
+        scale = (size - initialSize) / (maxSize - initialSize) if maxSize != initialSize else 1
+
+        frame = pygame.transform.scale(text_surface, (size, size))
+        frame.set_alpha(int(255 * scale))
+        frames.append(frame)
+
+    return frames
+
+# Returns the circle's animation frame for the time left and its rect
+def animateCircleInAndOut(colorRGB, center, initialRadius, maxRadius, maxAlpha, totalDuration, timeLeft, animationDuration):
     time_passed = totalDuration - timeLeft
 
     # Calculate current circle scale
@@ -59,17 +80,39 @@ def animateCircleInAndOut(surface, colorRGB, center, initialRadius, maxRadius, m
     radius = int(initialRadius + (maxRadius - initialRadius) * scale)
     alpha = min(int(255 * scale), maxAlpha)
 
-    # Create a temporary surface with alpha support to draw the circle
-    temp_surface = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+    # Reuse the surface with the circle if it was already drawn
+    temp_surface = getCircle(colorRGB, radius, alpha)
+
+    # Get the rect and set the position
+    circle_rect = temp_surface.get_rect(center=center)
+
+    return temp_surface, circle_rect
+
+# Returns a transparent surface with a circle, rendered only the first time
+def getCircle(colorRGB, radius, alpha):
+    return circle_cache.get((colorRGB, radius, alpha), lambda: renderCircle(colorRGB, radius, alpha))
+
+# Returns an opaque ring on a transparent background, rendered only the first time
+def getRing(colorRGB, radius, width):
+    return circle_cache.get(("ring", colorRGB, radius, width), lambda: renderRing(colorRGB, radius, width))
+
+def renderRing(colorRGB, radius, width):
+    # Transparency from a color key instead of an alpha channel, so blitting the ring is a plain copy
+    ring_surface = pygame.Surface((2 * radius, 2 * radius))
+    ring_surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+
+    pygame.draw.circle(ring_surface, colorRGB, (radius, radius), radius, width)
+
+    return ring_surface
+
+def renderCircle(colorRGB, radius, alpha):
+    # Create a surface with alpha support to draw the circle
+    circle_surface = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
 
     # Create an RGBA color tuple including the alpha value
     rgba_color = colorRGB + (alpha,)
 
     # Draw the circle
-    pygame.draw.circle(temp_surface, rgba_color, (radius, radius), radius)
-
-    # Get the rect and set the position
-    circle_rect = temp_surface.get_rect(center=center)
+    pygame.draw.circle(circle_surface, rgba_color, (radius, radius), radius)
 
-    # Display the circle
-    surface.blit(temp_surface, circle_rect)
\ No newline at end of file
+    return circle_surface
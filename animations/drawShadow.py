@@ -1,9 +1,24 @@
 import pygame
 
-def draw_shadow(surface, x, y, width, height=None, offset=10, alpha=64):
+from classes.EffectCache import EffectCache
+
+# Pre-rendered shadows, keyed by size and transparency
+shadow_cache = EffectCache(maxSize = 32)
+
+# Returns the shadow's surface and where it has to be drawn
+def get_shadow(x, y, width, height=None, offset=10, alpha=64):
     # Set default height to half of the width if not provided
     height = height or width // 2
 
+    # Reuse the transparent surface with the shadow if it was already drawn
+    shadow_surface = shadow_cache.get((int(width), int(height), alpha), lambda: render_shadow(width, height, alpha))
+
+    # Calculate shadow position on the main surface
+    shadow_position = (x, y + offset)
+
+    return shadow_surface, shadow_position
+
+def render_shadow(width, height, alpha):
     # Create a transparent surface
     shadow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
 
@@ -14,8 +29,4 @@ def draw_shadow(surface, x, y, width, height=None, offset=10, alpha=64):
     shadow_rect = pygame.Rect(0, 0, width, height)
     pygame.draw.ellipse(shadow_surface, SHADOW_COLOR, shadow_rect)
 
-    # Calculate shadow position on the main surface
-    shadow_position = (x, y + offset)
-
-    # Blit the shadow surface onto the main surface
-    surface.blit(shadow_surface, shadow_position)
\ No newline at end of file
+    return shadow_surface
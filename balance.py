@@ -0,0 +1,167 @@
+# Plays thousands of seeded headless games with the bot on every core, for a grid of difficulty settings
+# Every setting gets its score distribution, survival time and enemy/power-up rates in one JSON file
+# Example: python balance.py --games 500 --set enemy_chance=3,4,5 --set moving_chance=5,10
+
+import os
+import json
+import time
+import itertools
+import statistics
+import argparse
+import multiprocessing
+
+# Make sure pygame never opens a window or an audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from headless import createHeadlessWorld, botInputs
+from classes.Platform import DEFAULT_DIFFICULTY
+from classes.FrameTimer import percentile
+
+MAX_FRAMES = 45 * 60 * 10 # Games the bot survives for 10 minutes are stopped
+GAMES_PER_TASK = 25 # Games sent to a worker at once, so workers rarely wait for new ones
+SCORE_BIN = 10 # Width of the score histogram's bins
+
+# World of the current worker process, created once by initWorker
+worker_world = None
+
+# Function run once by every worker process
+def initWorker():
+    global worker_world
+    worker_world = createHeadlessWorld()
+
+# Function to play one game with the bot - Returns what happened in it
+def playGame(world, seed, maxFrames):
+    world.reset(seed)
+    pools = (world.platform_pool, world.enemy_pool, world.powerup_pool)
+    spawned = [pool.created + pool.reused for pool in pools]
+
+    while world.frame_count < maxFrames and world.step(botInputs(world)):
+        pass
+
+    platforms, enemies, powerups = (pool.created + pool.reused - count for pool, count in zip(pools, spawned))
+
+    return {
+        "score": world.dynamic["score"],
+        "frames": world.frame_count,
+        "platforms": platforms,
+        "enemies": enemies,
+        "powerups": powerups,
+        "powerups_collected": world.powerups_collected,
+        "cause_of_death": world.causeOfDeath() or "timeout",
+    }
+
+# Function run by the workers - Plays a batch of games with one difficulty setting
+def playGames(task):
+    index, difficulty, seeds, maxFrames = task
+    worker_world.difficulty = difficulty
+
+    return index, [playGame(worker_world, seed, maxFrames) for seed in seeds]
+
+# Function to summarize the games played with one setting
+def summarize(games):
+    scores = sorted(game["score"] for game in games)
+    frames = sorted(game["frames"] for game in games)
+    total = {key: sum(game[key] for game in games) for key in ("platforms", "enemies", "powerups", "powerups_collected")}
+
+    histogram = {}
+
+    for score in scores:
+        low = score // SCORE_BIN * SCORE_BIN
+        histogram[f"{low}-{low + SCORE_BIN - 1}"] = histogram.get(f"{low}-{low + SCORE_BIN - 1}", 0) + 1
+
+    causes = {}
+
+    for game in games:
+        causes[game["cause_of_death"]] = causes.get(game["cause_of_death"], 0) + 1
+
+    return {
+        "games": len(games),
+        "score": {
+            "mean": round(statistics.fmean(scores), 2),
+            "p10": percentile(scores, 0.1),
+            "median": percentile(scores, 0.5),
+            "p90": percentile(scores, 0.9),
+            "max": scores[-1],
+            "histogram": histogram,
+        },
+        "survival_frames": {
+            "mean": round(statistics.fmean(frames), 1),
+            "median": percentile(frames, 0.5),
+            "p90": percentile(frames, 0.9),
+        },
+        "enemies_per_platform": round(total["enemies"] / max(total["platforms"], 1), 4),
+        "powerups_per_platform": round(total["powerups"] / max(total["platforms"], 1), 4),
+        "powerups_collected_rate": round(total["powerups_collected"] / max(total["powerups"], 1), 4),
+        "cause_of_death": dict(sorted(causes.items())),
+    }
+
+# Function to parse the --set options into a list of difficulty settings, one for every combination
+def difficultyGrid(options):
+    values = {}
+
+    for option in options:
+        key, _, numbers = option.partition("=")
+
+        if key not in DEFAULT_DIFFICULTY:
+            raise ValueError(f"unknown difficulty parameter '{key}' (choose from {', '.join(DEFAULT_DIFFICULTY)})")
+
+        values[key] = [float(number) for number in numbers.split(",")]
+
+    return [dict(DEFAULT_DIFFICULTY, **dict(zip(values, combination))) for combination in itertools.product(*values.values())]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Monte Carlo difficulty tuning with the headless bot")
+    parser.add_argument("--games", type = int, default = 1000, help = "games played with every setting")
+    parser.add_argument("--seed", type = int, default = 0, help = "seed of the first game - Every setting plays the same seeds")
+    parser.add_argument("--set", dest = "sweep", metavar = "NAME=V1,V2", action = "append", default = [], help = "difficulty values to try (repeat for a grid)")
+    parser.add_argument("--max-frames", type = int, default = MAX_FRAMES, help = "frames after which a game is stopped")
+    parser.add_argument("--workers", type = int, default = os.cpu_count(), help = "worker processes")
+    parser.add_argument("--output", metavar = "FILE", default = "balance.json", help = "where to write the results")
+    args = parser.parse_args()
+
+    try:
+        grid = difficultyGrid(args.sweep)
+    except ValueError as error:
+        parser.error(str(error))
+
+    # Small batches of seeds, interleaved between the settings so every worker stays busy until the end
+    seeds = range(args.seed, args.seed + args.games)
+    tasks = [(index, difficulty, seeds[start:start + GAMES_PER_TASK], args.max_frames)
+             for start in range(0, args.games, GAMES_PER_TASK) for index, difficulty in enumerate(grid)]
+
+    results = [[] for _ in grid]
+    start = time.perf_counter()
+
+    pool = multiprocessing.Pool(args.workers, initializer = initWorker)
+
+    for done, (index, games) in enumerate(pool.imap_unordered(playGames, tasks), 1):
+        results[index].extend(games)
+        print(f"\r{done}/{len(tasks)} batches", end = "", flush = True)
+
+    # Let the workers exit on their own - SDL catches the SIGTERM that Pool.terminate would send them
+    pool.close()
+    pool.join()
+
+    elapsed = time.perf_counter() - start
+    played = sum(len(games) for games in results)
+
+    print(f"\rPlayed {played} games with {args.workers} workers in {elapsed:.1f}s - {played / elapsed:.1f} games/sec")
+
+    report = {
+        "games_per_setting": args.games,
+        "first_seed": args.seed,
+        "max_frames": args.max_frames,
+        "workers": args.workers,
+        "seconds": round(elapsed, 2),
+        "settings": [{"difficulty": difficulty, **summarize(games)} for difficulty, games in zip(grid, results)],
+    }
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent = 4)
+
+    for setting in report["settings"]:
+        changed = {key: value for key, value in setting["difficulty"].items() if value != DEFAULT_DIFFICULTY[key]}
+        print(f"{json.dumps(changed) if changed else 'default':<50} score {setting['score']['mean']:>7.1f} mean {setting['score']['median']:>5} median - {setting['survival_frames']['mean']:>8.0f} frames")
+
+    print(f"Results written to {args.output}")
@@ -0,0 +1,64 @@
+# Compares blitting the sprites as loaded, converted to the display format, and from the texture atlas
+# Run from the repository's root: python benchmarks/blits.py
+
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from classes.Assets import Assets
+
+# Function to list every image of an images dictionary, in drawing order
+def flattenImages(images):
+    flat = [images["background"], images["clouds"], images["platform"]]
+
+    for frames in images["player"].values():
+        flat.extend(frames)
+
+    flat.extend(images["enemy"].values())
+    flat.extend(images["powerup"].values())
+
+    return flat
+
+# Function to time blitting every image onto the display a number of times - Returns blits per second
+def timeBlits(surface, images, rounds):
+    start = time.perf_counter()
+
+    for _ in range(rounds):
+        for image in images:
+            surface.blit(image, (0, 0))
+
+    return rounds * len(images) / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Blit benchmark for loaded, converted and atlas sprites")
+    parser.add_argument("--rounds", type = int, default = 200, help = "times every image is blitted")
+    args = parser.parse_args()
+
+    pygame.init()
+    surface = pygame.display.set_mode((500, 800))
+
+    # The background is much bigger than the sprites, so it is measured apart
+    loaded = Assets(loadSounds = False)
+    converted = Assets(loadSounds = False)
+    converted.convertImages()
+
+    loaded_images = flattenImages(loaded.images)
+    converted_images = flattenImages(converted.images)
+
+    results = {
+        "background (loaded)": timeBlits(surface, loaded_images[:1], args.rounds),
+        "background (converted)": timeBlits(surface, converted_images[:1], args.rounds),
+        "sprites (loaded)": timeBlits(surface, loaded_images[1:], args.rounds),
+        "sprites (converted atlas)": timeBlits(surface, converted_images[1:], args.rounds),
+    }
+
+    for name, blits_per_second in results.items():
+        print(f"{name:<28}{blits_per_second:>12.0f} blits/sec")
+
+    pygame.quit()
@@ -0,0 +1,100 @@
+# Reports the memory used by every entity and how many entities are allocated while the game runs
+# Both with the current entities and pools, and with entities that keep their attributes in a dictionary and are never recycled
+# Run from the repository's root: python benchmarks/entities.py
+
+import os
+import sys
+import time
+import tracemalloc
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import createHeadlessWorld, botInputs
+from classes.Platform import Platform
+from classes.Enemy import Enemy
+from classes.PowerUp import PowerUp
+from classes.EntityPool import EntityPool
+
+# Returns a copy of an entity class without __slots__, so its instances keep their attributes in a dictionary
+def withoutSlots(entityClass):
+    members = {name: value for name, value in vars(entityClass).items() if name not in entityClass.__slots__ and name != "__slots__"}
+
+    return type(f"Dict{entityClass.__name__}", (), members)
+
+# Function to make a world build every entity from scratch, with classes without __slots__ - Like before entities were pooled
+def removePools(world):
+    world.platform_pool = EntityPool(withoutSlots(Platform), 0)
+    world.enemy_pool = EntityPool(withoutSlots(Enemy), 0)
+    world.powerup_pool = EntityPool(withoutSlots(PowerUp), 0)
+    world.reset(world.seed)
+
+# Function to measure the bytes used by one instance, rectangles included
+def instanceSize(create, count = 1000):
+    tracemalloc.start()
+    instances = [create() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return size / len(instances)
+
+# Function to count the entities built from scratch (not recycled) while simulating
+# Returns the entities built and recycled per frame, and the microseconds every frame took
+def constructionsPerFrame(world, frames, warmUpFrames):
+    pools = (world.platform_pool, world.enemy_pool, world.powerup_pool)
+
+    # Invincibility keeps the bot alive, so the level keeps scrolling
+    def policy(world):
+        inputs = botInputs(world)
+        inputs["invincibility"] = True
+
+        return inputs
+
+    for _ in range(warmUpFrames):
+        world.step(policy(world))
+
+    created = sum(pool.created for pool in pools)
+    reused = sum(pool.reused for pool in pools)
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        world.step(policy(world))
+
+    elapsed = time.perf_counter() - start
+
+    return (sum(pool.created for pool in pools) - created) / frames, (sum(pool.reused for pool in pools) - reused) / frames, elapsed / frames * 1e6
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Entity memory and allocation report")
+    parser.add_argument("--frames", type = int, default = 20000, help = "frames to simulate after warming up")
+    parser.add_argument("--seed", type = int, default = 1, help = "seed of the simulated game")
+    args = parser.parse_args()
+
+    images = createHeadlessWorld(args.seed).images
+    classes = {"slots": (Platform, Enemy, PowerUp), "dict": tuple(withoutSlots(entityClass) for entityClass in (Platform, Enemy, PowerUp))}
+    sizes = {}
+
+    for name, (platform_class, enemy_class, powerup_class) in classes.items():
+        sizes[name] = (
+            instanceSize(lambda: platform_class(images['platform'], [20, 480], 0)),
+            instanceSize(lambda: enemy_class(images['enemy'], [20, 200], 0, {})),
+            instanceSize(lambda: powerup_class(images['powerup'], [20, 200], 0, {})),
+        )
+
+    # The same game, with pooled entities and with dictionary entities built every time
+    pooled_world = createHeadlessWorld(args.seed)
+    unpooled_world = createHeadlessWorld(args.seed)
+    removePools(unpooled_world)
+
+    pooled = constructionsPerFrame(pooled_world, args.frames, warmUpFrames = 2000)
+    unpooled = constructionsPerFrame(unpooled_world, args.frames, warmUpFrames = 2000)
+
+    print(f"{'':<32}{'before':>12}{'after':>12}")
+
+    for i, entity in enumerate(("Platform", "Enemy", "PowerUp")):
+        print(f"{entity + ' bytes per instance':<32}{sizes['dict'][i]:>12.0f}{sizes['slots'][i]:>12.0f}")
+
+    print(f"{'Entities allocated per frame':<32}{unpooled[0]:>12.4f}{pooled[0]:>12.4f}")
+    print(f"{'Entities recycled per frame':<32}{unpooled[1]:>12.4f}{pooled[1]:>12.4f}")
+    print(f"{'Microseconds per frame':<32}{unpooled[2]:>12.1f}{pooled[2]:>12.1f}")
+    print(f"Before: dictionary entities without pools - After: __slots__ entities recycled by pools - Score reached {pooled_world.dynamic['score']}")
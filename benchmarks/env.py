@@ -0,0 +1,46 @@
+# Measures how many environment steps per second the vectorized environment plays, for several batch sizes and worker counts
+# Run from the repository's root: python benchmarks/env.py --batch-sizes 1 8 32 --workers 0 2 4
+
+import os
+import sys
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from classes.VectorPlutoEnv import VectorPlutoEnv
+
+# Function to play random actions - Returns environment steps per second
+def timeSteps(env, steps, seed):
+    rng = np.random.default_rng(seed)
+    env.reset(seed)
+
+    start = time.perf_counter()
+
+    for _ in range(steps):
+        env.step(rng.integers(0, env.action_count, env.count))
+
+    return steps * env.count / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Throughput of the vectorized environment")
+    parser.add_argument("--batch-sizes", type = int, nargs = "+", default = [1, 8, 32], help = "environments stepped with one call")
+    parser.add_argument("--workers", type = int, nargs = "+", default = [0, 2, os.cpu_count()], help = "worker processes (0 plays in this process)")
+    parser.add_argument("--observation", choices = ("features", "pixels"), default = "features", help = "kind of observation")
+    parser.add_argument("--steps", type = int, default = 500, help = "calls to step for every configuration")
+    parser.add_argument("--seed", type = int, default = 1, help = "seed of the first environment")
+    args = parser.parse_args()
+
+    print(f"{'batch':>6}{'workers':>9}{'steps/sec':>12}")
+
+    for batch_size in args.batch_sizes:
+        for workers in sorted(set(args.workers)):
+            env = VectorPlutoEnv(batch_size, workers = workers, observation = args.observation)
+            rate = timeSteps(env, args.steps, args.seed)
+            env.close()
+
+            print(f"{batch_size:>6}{workers:>9}{rate:>12.0f}")
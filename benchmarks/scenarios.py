@@ -0,0 +1,268 @@
+# Plays scripted scenarios without a window and reports how fast the game simulates and renders them
+# Results are written as JSON, and compared with a baseline so regressions make the run fail
+# Baselines only mean something on the machine they were recorded on, so record your own first:
+#   python benchmarks/scenarios.py --baseline baseline.json --save-baseline
+#   python benchmarks/scenarios.py --baseline baseline.json
+
+import os
+import sys
+import gc
+import json
+import time
+import statistics
+import platform
+import tracemalloc
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from headless import botInputs
+from classes.Assets import Assets
+from classes.GameWorld import INPUT_NAMES, WINDOW_WIDTH, WINDOW_HEIGHT, worldClass
+from classes.Renderer import Renderer
+from classes.FontManager import FontManager
+from classes.Button import Button
+from classes.FrameTimer import percentile
+
+FONT_FAMILY = "calibri, helvetica, arial"
+DENSE_SCORE = 200 # Score where (almost) every platform gets an enemy or a power-up
+MODES = ("simulation", "render")
+NOISE_FLOOR_MS = 0.05 # Smaller changes of the median frame time are never regressions
+
+# Policies of the scenarios: functions that return the inputs of the next step
+def idleInputs(world):
+    return dict.fromkeys(INPUT_NAMES, False)
+
+def jumpingInputs(world):
+    inputs = idleInputs(world)
+    inputs["jump"] = True
+
+    return inputs
+
+# The bot keeps invincibility on, so it flies through the enemies and they fly away
+def invincibleInputs(world):
+    inputs = botInputs(world)
+    inputs["invincibility"] = True
+
+    return inputs
+
+# Scenario name: (policy, pinned score) - A pinned score keeps the level as dense as it is at that score
+SCENARIOS = {
+    "idle": (idleInputs, None),
+    "jumping": (jumpingInputs, None),
+    "score_0": (botInputs, 0),
+    "score_200": (botInputs, DENSE_SCORE),
+    "invincible": (invincibleInputs, DENSE_SCORE),
+    "end_screen": (None, None), # Only rendered, nothing is simulated
+}
+
+# Function to create the game's objects once, like main.py does
+def createGame(backend, seed):
+    pygame.init()
+    surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    assets = Assets(loadSounds = False)
+    assets.convertImages()
+
+    fonts = FontManager(FONT_FAMILY)
+    world = worldClass(backend)(assets.images, seed = seed)
+    renderer = Renderer(surface, assets.images, fonts.get(25, bold = True))
+
+    buttons = [
+        Button(text = "Play Again", x = WINDOW_WIDTH // 2 - 100, y = WINDOW_HEIGHT // 2 - 25, callback = lambda: None, font = fonts.get(25, bold = True)),
+        Button(text = "Exit Game", x = WINDOW_WIDTH // 2 - 100, y = WINDOW_HEIGHT // 2 + 45, callback = lambda: None, font = fonts.get(25, bold = True)),
+    ]
+
+    return {"surface": surface, "world": world, "renderer": renderer, "buttons": buttons, "score_font": fonts.get(37, bold = True)}
+
+# Returns a function that plays one frame of a scenario
+def frameFunction(game, scenario, mode, seed):
+    world = game["world"]
+    renderer = game["renderer"]
+    policy, score = SCENARIOS[scenario]
+
+    world.reset(seed)
+    renderer.target_background_y_position = None
+
+    # The end screen draws the background, the final score and the buttons, like displayEndScreen
+    if policy is None:
+        surface = game["surface"]
+        score_surface = game["score_font"].render(f"Final Score: {world.dynamic['score']}", True, (255, 255, 255))
+        renderer.target_background_y_position = "end"
+
+        def frame():
+            renderer.drawBackground(world.pluto.camera_y_offset)
+            surface.blit(score_surface, score_surface.get_rect(center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 95)))
+
+            for button in game["buttons"]:
+                button.draw(surface)
+
+            pygame.display.flip()
+
+        return frame
+
+    def frame():
+        if score is not None:
+            world.dynamic["score"] = score
+
+        # Start over on the same level when pluto falls
+        if not world.step(policy(world)):
+            world.reset(seed)
+
+        if mode == "render":
+            renderer.draw(world, 0)
+            renderer.present()
+
+    return frame
+
+# Function to play a scenario - Returns its frame rate, frame time percentiles and allocations
+def runScenario(game, scenario, mode, frames, warmUpFrames, seed):
+    frame = frameFunction(game, scenario, mode, seed)
+
+    for _ in range(warmUpFrames):
+        frame()
+
+    # Timed pass - Garbage collections tell how many objects are allocated without slowing anything down
+    collections = sum(generation["collections"] for generation in gc.get_stats())
+    durations = []
+
+    for _ in range(frames):
+        start = time.perf_counter()
+        frame()
+        durations.append(time.perf_counter() - start)
+
+    collections = sum(generation["collections"] for generation in gc.get_stats()) - collections
+
+    # Separate pass to measure memory, tracing allocations is too slow to be timed
+    tracemalloc.start()
+    baseline_memory = tracemalloc.get_traced_memory()[0]
+
+    for _ in range(min(frames, 200)):
+        frame()
+
+    current_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    durations.sort()
+
+    return {
+        "fps": frames / sum(durations),
+        "p50_ms": percentile(durations, 0.5) * 1000,
+        "p95_ms": percentile(durations, 0.95) * 1000,
+        "p99_ms": percentile(durations, 0.99) * 1000,
+        "gc_collections_per_1000_frames": collections * 1000 / frames,
+        "peak_memory_kib": (peak_memory - baseline_memory) / 1024,
+        "retained_memory_kib": (current_memory - baseline_memory) / 1024,
+    }
+
+# Function to play a scenario several times - Returns the median of every value, so one disturbed repeat doesn't count
+def repeatScenario(game, scenario, mode, frames, warmUpFrames, seed, repeats):
+    runs = [runScenario(game, scenario, mode, frames, warmUpFrames, seed) for _ in range(repeats)]
+
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+# Function to compare results with a baseline - Returns a description of every regression
+# Only the median frame time is compared: the frame rate and the high percentiles move with whatever else the machine is doing
+def compareResults(results, baseline, tolerance):
+    regressions = []
+
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        previous = baseline[key]
+        slower = result["p50_ms"] - previous["p50_ms"]
+
+        if result["p50_ms"] > previous["p50_ms"] * (1 + tolerance) and slower > NOISE_FLOOR_MS:
+            regressions.append(f"{key}: p50 {result['p50_ms']:.3f} ms, baseline {previous['p50_ms']:.3f} ms")
+
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Scripted headless scenarios for the simulation and the renderer")
+    parser.add_argument("--scenarios", nargs = "+", choices = SCENARIOS, default = list(SCENARIOS), help = "scenarios to play")
+    parser.add_argument("--modes", nargs = "+", choices = MODES, default = list(MODES), help = "simulation only, or simulation and rendering")
+    parser.add_argument("--backend", choices = ("objects", "numpy"), default = "objects", help = "how entities are updated")
+    parser.add_argument("--frames", type = int, default = 1000, help = "timed frames for every scenario")
+    parser.add_argument("--warm-up", type = int, default = 100, help = "frames played before timing")
+    parser.add_argument("--seed", type = int, default = 1, help = "seed of the level")
+    parser.add_argument("--output", metavar = "FILE", default = "benchmarks/results.json", help = "where to write the results")
+    parser.add_argument("--repeats", type = int, default = 5, help = "times every scenario is played - The median of the repeats is reported")
+    parser.add_argument("--baseline", metavar = "FILE", default = None, help = "results of a previous run on this machine to compare with")
+    parser.add_argument("--save-baseline", action = "store_true", help = "write the results to the baseline file instead of comparing with it")
+    parser.add_argument("--tolerance", type = float, default = 0.15, help = "how much slower than the baseline the median frame may be (0.15 is 15%%)")
+    args = parser.parse_args()
+
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline needs --baseline FILE")
+
+    game = createGame(args.backend, args.seed)
+    results = {}
+
+    print(f"{'scenario':<24}{'fps':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'gc/1k':>8}{'peak KiB':>10}")
+
+    for scenario in args.scenarios:
+        for mode in args.modes:
+            # The end screen has nothing to simulate
+            if SCENARIOS[scenario][0] is None and mode == "simulation":
+                continue
+
+            key = f"{scenario}/{mode}"
+            result = results[key] = repeatScenario(game, scenario, mode, args.frames, args.warm_up, args.seed, max(args.repeats, 1))
+
+            print(f"{key:<24}{result['fps']:>10.0f}{result['p50_ms']:>10.3f}{result['p95_ms']:>10.3f}{result['p99_ms']:>10.3f}"
+                  f"{result['gc_collections_per_1000_frames']:>8.1f}{result['peak_memory_kib']:>10.1f}")
+
+    report = {
+        "backend": args.backend,
+        "frames": args.frames,
+        "repeats": args.repeats,
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.platform(),
+        "results": results,
+    }
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent = 4)
+
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent = 4)
+
+        print(f"Baseline written to {args.baseline}")
+
+    elif args.baseline:
+        try:
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+        except FileNotFoundError:
+            print(f"No baseline at {args.baseline} - Record one with --save-baseline")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Error loading baseline {args.baseline}: {e}")
+            sys.exit(1)
+
+        # Frame times from another machine or backend can't tell if this code got slower
+        if baseline.get("machine") != report["machine"] or baseline.get("backend") != args.backend:
+            print(f"The baseline was measured on {baseline.get('machine')} with the {baseline.get('backend')} backend - Record one on this machine with --save-baseline")
+            sys.exit(1)
+
+        regressions = compareResults(results, baseline["results"], args.tolerance)
+
+        if regressions:
+            print(f"PERFORMANCE REGRESSION - {len(regressions)} result(s) more than {args.tolerance:.0%} worse than {args.baseline}:")
+
+            for regression in regressions:
+                print(f"  {regression}")
+
+            sys.exit(1)
+
+        print(f"No regressions compared to {args.baseline}")
@@ -0,0 +1,103 @@
+# Restarts the game thousands of times through main.py's game loop and checks that memory and call depth stay the same
+# Every game plays back a few recorded frames, then a timer keeps pressing 'p' so the end screen starts the next one
+# Run from the repository's root: python benchmarks/soak.py --games 2000
+
+import os
+import sys
+import gc
+import time
+import tempfile
+import tracemalloc
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from headless import createHeadlessWorld
+from classes.GameWorld import INPUT_NAMES
+from classes.Replay import Replay
+
+KEY_INTERVAL = 10 # Milliseconds between two presses of 'p'
+
+# Function to record a game of "frames" steps where pluto stands still
+def recordShortGame(path, frames, seed):
+    world = createHeadlessWorld(seed)
+    replay = Replay(world.seed)
+    inputs = dict.fromkeys(INPUT_NAMES, False)
+
+    for _ in range(frames):
+        world.step(inputs)
+        replay.record(world, inputs)
+
+    replay.save(path)
+
+# Returns the number of calls below the current one
+def callDepth():
+    frame = sys._getframe(1)
+    depth = 0
+
+    while frame:
+        frame = frame.f_back
+        depth += 1
+
+    return depth
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Soak test for restarting the game")
+    parser.add_argument("--games", type = int, default = 2000, help = "games to play")
+    parser.add_argument("--checkpoints", type = int, default = 10, help = "times memory is measured")
+    parser.add_argument("--frames", type = int, default = 3, help = "frames played in every game")
+    parser.add_argument("--max-growth", type = float, default = 256, help = "KiB memory may grow between the first and last checkpoint")
+    args = parser.parse_args()
+
+    replay_path = os.path.join(tempfile.mkdtemp(), "soak.replay")
+    recordShortGame(replay_path, args.frames, seed = 1)
+
+    # main.py reads its options and loads everything when imported
+    sys.argv = ["main.py", "--replay", replay_path, "--turbo", str(args.frames), "--fps", "1000"]
+    import main
+
+    # Record the call depth every time a state starts
+    depths = set()
+
+    for state, function in list(main.STATES.items()):
+        def measured(function = function):
+            depths.add(callDepth())
+            return function()
+
+        main.STATES[state] = measured
+
+    pygame.time.set_timer(pygame.event.Event(pygame.KEYDOWN, key = pygame.K_p, mod = 0, unicode = "p", scancode = 0), KEY_INTERVAL)
+
+    games_per_checkpoint = max(args.games // args.checkpoints, 1)
+    memory = []
+    start = time.perf_counter()
+
+    # Warm up once, so caches filled by the first game don't count as growth
+    main.run(games = games_per_checkpoint)
+    tracemalloc.start()
+
+    for checkpoint in range(args.checkpoints):
+        main.run(games = games_per_checkpoint)
+
+        gc.collect()
+        memory.append(tracemalloc.get_traced_memory()[0] / 1024)
+
+        print(f"{(checkpoint + 2) * games_per_checkpoint:>8} games {memory[-1]:>10.1f} KiB traced - call depth {min(depths)} to {max(depths)}")
+
+    tracemalloc.stop()
+
+    games = (args.checkpoints + 1) * games_per_checkpoint
+    growth = memory[-1] - memory[0]
+
+    print(f"Played {games} games in {time.perf_counter() - start:.1f}s (recursion limit {sys.getrecursionlimit()})")
+    print(f"Memory growth after the first checkpoint: {growth:.1f} KiB - call depth {min(depths)} to {max(depths)}")
+
+    if max(depths) != min(depths) or growth > args.max_growth:
+        print("SOAK TEST FAILED")
+        sys.exit(1)
+
+    print("Soak test passed")
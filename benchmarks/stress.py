@@ -0,0 +1,70 @@
+# Fills the level with thousands of platforms, enemies and power-ups and compares how fast each backend simulates it
+# Run from the repository's root: python benchmarks/stress.py
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from headless import createHeadlessWorld
+from classes.GameWorld import INPUT_NAMES, PLATFORM_GAP
+
+DENSE_SCORE = 200 # Score where (almost) every platform gets an enemy or a power-up
+
+# Function to stack platforms on top of the level until it holds at least "count" entities
+def fillLevel(world, count):
+    score = world.dynamic["score"]
+    world.dynamic["score"] = DENSE_SCORE
+
+    # The first platform is placed by the world itself
+    world.createObjects()
+
+    while len(world.platforms) + len(world.enemies) + len(world.powerups) < count:
+        world.spawnPlatform(world.platforms[-1].y - PLATFORM_GAP)
+
+    world.dynamic["score"] = score
+
+# Function to time a number of steps on a filled level - Returns steps per second and the final state of every entity
+def timeSteps(world, count, frames):
+    world.reset(world.seed)
+    fillLevel(world, count)
+
+    # Keep pluto jumping and invincible, nothing it can do changes the amount of entities up there
+    inputs = dict.fromkeys(INPUT_NAMES, False)
+    inputs["jump"] = True
+    inputs["invincibility"] = True
+
+    start = time.perf_counter()
+
+    for _ in range(frames):
+        world.step(inputs)
+
+    elapsed = time.perf_counter() - start
+    state = [(entity.x, entity.y) for entities in (world.platforms, world.enemies, world.powerups) for entity in entities]
+
+    return frames / elapsed, state
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Entity update stress test for the objects and numpy backends")
+    parser.add_argument("--entities", type = int, nargs = "+", default = [100, 1000, 5000, 20000], help = "entity counts to test")
+    parser.add_argument("--frames", type = int, default = 300, help = "frames simulated for every count")
+    parser.add_argument("--seed", type = int, default = 1, help = "seed of the level")
+    args = parser.parse_args()
+
+    worlds = {backend: createHeadlessWorld(args.seed, backend) for backend in ("objects", "numpy")}
+
+    if type(worlds["numpy"]) is type(worlds["objects"]):
+        sys.exit()
+
+    print(f"{'entities':>10}{'objects':>16}{'numpy':>16}{'speed-up':>10}")
+
+    for count in args.entities:
+        objects_rate, objects_state = timeSteps(worlds["objects"], count, args.frames)
+        numpy_rate, numpy_state = timeSteps(worlds["numpy"], count, args.frames)
+
+        # Both backends must simulate exactly the same game
+        match = "" if objects_state == numpy_state else "  (states differ!)"
+
+        print(f"{count:>10}{objects_rate:>11.0f} fps{numpy_rate:>11.0f} fps{numpy_rate / objects_rate:>9.1f}x{match}")
@@ -0,0 +1,33 @@
+# Decodes every image and sound of the asset manifest and stores them in the asset cache, so the game starts without decoding anything
+# The game also rebuilds the cache by itself when a source file changes, this is for doing it ahead of time
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from classes.Assets import Assets, CACHE_PATH
+
+if __name__ == "__main__":
+    pygame.init()
+
+    # Sounds can only be decoded with a mixer, use a silent one if there is no audio device
+    if not pygame.mixer.get_init():
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+        pygame.mixer.init()
+
+    start = time.perf_counter()
+    assets = Assets(useCache = False)
+    saved = assets.saveCache()
+    elapsed = time.perf_counter() - start
+
+    if not saved:
+        print("The asset cache could not be built: some files failed to load")
+        sys.exit(1)
+
+    print(f"Built {CACHE_PATH} ({os.path.getsize(CACHE_PATH) / 2 ** 20:.1f} MB) in {elapsed:.2f}s")
+
+    pygame.quit()
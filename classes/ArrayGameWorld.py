@@ -0,0 +1,185 @@
+import numpy as np
+
+from classes.GameWorld import GameWorld, WINDOW_WIDTH, WINDOW_HEIGHT
+from classes.EntityArrays import EntityArrays
+from classes.Platform import Platform
+from classes.Enemy import Enemy
+from classes.PowerUp import PowerUp
+
+# Hitbox trims, the same the entities use in their updateHitbox methods
+PLATFORM_HITBOX_TOP = 7
+PLATFORM_HITBOX_HEIGHT = 20
+ENEMY_HITBOX_TOP = 10
+POWERUP_HITBOX_SIDES = 10
+
+FLOWN_AWAY_Y = 2000 # Where dead enemies wait to be removed, like Enemy.flyAway does
+
+class ArrayGameWorld(GameWorld):
+    # Constructor for ArrayGameWorld class - Same game as GameWorld, with the per-frame entity work done on NumPy arrays
+    def __init__(self, images, sounds = {}, seed = None):
+        # Entity state in structure-of-arrays form, one store per type
+        self.platform_arrays = EntityArrays()
+        self.enemy_arrays = EntityArrays()
+        self.powerup_arrays = EntityArrays()
+
+        self.arrays = {Platform: self.platform_arrays, Enemy: self.enemy_arrays, PowerUp: self.powerup_arrays}
+
+        # Objects whose position changed on the last step
+        self.moved_entities = []
+
+        super().__init__(images, sounds, seed)
+
+    # Method to put the world back in its initial state
+    def reset(self, seed = None):
+        super().reset(seed)
+
+        self.moved_entities = []
+
+    # Method to put a new object at the top of its list and store its state in the arrays
+    def addEntity(self, entities, entity):
+        super().addEntity(entities, entity)
+
+        if isinstance(entity, Platform):
+            box = (0, PLATFORM_HITBOX_TOP, entity.width, PLATFORM_HITBOX_HEIGHT)
+            self.platform_arrays.add(entity, box, entity.type == "moving", entity.speed, entity.direction, entity.min_x_value, entity.max_x_value)
+
+        elif isinstance(entity, Enemy):
+            box = (0, ENEMY_HITBOX_TOP, entity.width, entity.height - ENEMY_HITBOX_TOP)
+            self.enemy_arrays.add(entity, box, entity.moving_enemy, entity.speed, entity.direction, entity.min_x_value, entity.max_x_value)
+
+        else:
+            box = (-POWERUP_HITBOX_SIDES, 0, entity.width + POWERUP_HITBOX_SIDES * 2, entity.height)
+            self.powerup_arrays.add(entity, box)
+
+    # Method to remove an object from the arrays and hand it back to its pool
+    def releaseEntity(self, pool, entity):
+        self.arrays[type(entity)].remove(entity)
+
+        super().releaseEntity(pool, entity)
+
+    # Method to store the current positions - Only the objects that moved can have a different position than last time
+    def savePreviousState(self):
+        self.previous_camera_y_offset = self.pluto.camera_y_offset
+
+        self.savePreviousPosition(self.pluto)
+
+        for entity in self.moved_entities:
+            self.savePreviousPosition(entity)
+
+        self.moved_entities = []
+
+    # Method to move every platform, enemy and power-up one frame forward as batch operations
+    def updateObjects(self):
+        pluto = self.pluto
+
+        # Hitboxes and sprite rectangles are taken before moving, as the entities' tick methods do
+        for arrays in self.arrays.values():
+            arrays.refreshHitboxes()
+            arrays.syncRects(pluto.camera_y_offset)
+
+        # Moving platforms carry pluto along when it stands on them
+        platforms = self.platform_arrays
+        moving = platforms.active & platforms.moving
+        velocity = platforms.velocity()
+
+        for slot in np.flatnonzero(moving & platforms.overlapping(pluto.hitbox)):
+            pluto.x += float(velocity[slot])
+
+        turned = platforms.move(moving)
+
+        self.copyX(platforms, np.flatnonzero(moving))
+        self.copyDirections(platforms, turned)
+
+        # Dead enemies fly away while they are on the screen, then wait below it
+        enemies = self.enemy_arrays
+        dead = enemies.active & ~enemies.alive
+
+        if dead.any():
+            screen_y = np.trunc(enemies.y + pluto.camera_y_offset)
+            flying = dead & (0 <= enemies.x) & (enemies.x <= WINDOW_WIDTH) & (0 <= screen_y) & (screen_y <= WINDOW_HEIGHT)
+            flown_away = dead & ~flying
+
+            enemies.x[flying] += enemies.x_flying_speed[flying]
+            enemies.y[flying] += enemies.y_flying_speed[flying]
+            enemies.y[flown_away] = FLOWN_AWAY_Y
+
+            self.copyXY(enemies, np.flatnonzero(flying))
+
+            for slot in np.flatnonzero(flown_away).tolist():
+                enemy = enemies.entities[slot]
+
+                if enemy.y != FLOWN_AWAY_Y:
+                    enemy.y = FLOWN_AWAY_Y
+                    self.moved_entities.append(enemy)
+
+        # Alive enemies walk along their platform
+        walking = enemies.active & enemies.alive & enemies.moving
+        turned = enemies.move(walking)
+
+        self.copyX(enemies, np.flatnonzero(walking))
+        self.copyDirections(enemies, turned)
+
+        for slot in turned:
+            enemy = enemies.entities[slot]
+            enemy.current_sprite = enemy.sprite_left if enemy.direction == -1 else enemy.sprite_right
+
+    # Method to handle enemies and power-ups touching pluto, tested against every hitbox at once
+    def handleCollisions(self):
+        pluto = self.pluto
+        enemies = self.enemy_arrays
+        powerups = self.powerup_arrays
+
+        # Handle enemy collision with pluto
+        for slot in np.flatnonzero(enemies.overlapping(pluto.hitbox)):
+            enemy = enemies.entities[slot]
+
+            if self.dynamic["invincibility"]["active"]:
+                enemy.die(playerFeetCoordinates = (pluto.x + pluto.width / 2, pluto.y + pluto.height - 10))
+
+                enemies.alive[slot] = False
+                enemies.x_flying_speed[slot] = enemy.x_flying_speed
+                enemies.y_flying_speed[slot] = enemy.y_flying_speed
+
+            else:
+                pluto.die()
+
+        # Handle power-up collision with pluto
+        collected = np.flatnonzero(powerups.overlapping(pluto.hitbox))
+
+        for slot in collected:
+            powerup = powerups.entities[slot]
+            powerup.applyEffect(self.dynamic, self.frame_rate)
+            self.powerups_collected += 1
+
+            # Move power-up out of the screen so it's deleted by removeOffScreenObjects method
+            powerup.y = WINDOW_HEIGHT * 2
+            powerups.y[slot] = powerup.y
+            powerups.alive[slot] = False
+            self.moved_entities.append(powerup)
+
+            # Take it off its platform, which is around pluto
+            for platform in self.platformsNear(pluto.hitbox.top, pluto.hitbox.bottom):
+                if platform.powerup is powerup:
+                    platform.powerup = None
+
+    # Method to copy the x-coordinates in "slots" back into the entity objects
+    def copyX(self, arrays, slots):
+        entities = arrays.entities
+
+        for slot, x in zip(slots.tolist(), arrays.x[slots].tolist()):
+            entities[slot].x = x
+            self.moved_entities.append(entities[slot])
+
+    # Method to copy both coordinates in "slots" back into the entity objects
+    def copyXY(self, arrays, slots):
+        entities = arrays.entities
+
+        for slot, x, y in zip(slots.tolist(), arrays.x[slots].tolist(), arrays.y[slots].tolist()):
+            entities[slot].x = x
+            entities[slot].y = y
+            self.moved_entities.append(entities[slot])
+
+    # Method to copy the directions in "slots" back into the entity objects
+    def copyDirections(self, arrays, slots):
+        for slot in slots.tolist():
+            arrays.entities[slot].direction = int(arrays.direction[slot])
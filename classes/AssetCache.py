@@ -0,0 +1,129 @@
+import pygame
+import os
+import json
+import mmap
+import struct
+import hashlib
+
+CACHE_MAGIC = b"PLAC"
+CACHE_VERSION = 1
+HEADER_FORMAT = "<4sH32sI" # Magic, version, hash of the sources, size of the index
+ALIGNMENT = 64 # Every buffer starts on a multiple of this, so it can be used straight from the mapping
+
+# Pixels are stored in the byte order of 32-bit displays, so converting them is a plain copy
+PIXEL_FORMAT = "BGRA"
+
+# Returns a hash of every source file and of everything else that changes how they are decoded
+def sourcesHash(paths):
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION} {PIXEL_FORMAT} {pygame.version.ver} {pygame.mixer.get_init()}".encode())
+
+    for path in sorted(paths):
+        digest.update(path.encode())
+
+        with open(path, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+
+    return digest.digest()
+
+# Returns how many bytes have to be added to "size" so it becomes a multiple of the alignment
+def paddingFor(size):
+    return -size % ALIGNMENT
+
+class AssetCache:
+    # Constructor for AssetCache class - Maps a cache file so its buffers can be used without reading them
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            # Copy-on-write mapping: pages are shared with the file until somebody writes to a surface
+            self.mapping = mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_COPY)
+
+        magic, self.version, self.sources_hash, index_size = struct.unpack_from(HEADER_FORMAT, self.mapping)
+        index_start = struct.calcsize(HEADER_FORMAT)
+
+        if magic != CACHE_MAGIC:
+            raise ValueError(f"{path} is not an asset cache")
+
+        self.index = json.loads(self.mapping[index_start:index_start + index_size])
+        self.buffer = memoryview(self.mapping)
+
+    # Returns the cache at "path" if it was built from the same sources, None otherwise
+    @classmethod
+    def open(cls, path, sourcesHash):
+        if not os.path.exists(path):
+            return None
+
+        try:
+            cache = cls(path)
+        except Exception as e:
+            print(f"Error reading asset cache {path}: {e}")
+            return None
+
+        if cache.version != CACHE_VERSION or cache.sources_hash != sourcesHash:
+            cache.close()
+            return None
+
+        return cache
+
+    # Method to unmap the cache file - Only possible while no surface uses its buffers
+    def close(self):
+        self.buffer.release()
+        self.mapping.close()
+
+    # Returns the buffer stored for "path"
+    def view(self, path):
+        entry = self.index[path]
+
+        return self.buffer[entry["offset"]:entry["offset"] + entry["length"]]
+
+    # Returns the image stored for "path" - The surface uses the mapped pixels directly
+    def image(self, path):
+        return pygame.image.frombuffer(self.view(path), self.index[path]["size"], PIXEL_FORMAT)
+
+    # Returns the sound stored for "path" - pygame copies the samples into the mixer
+    def sound(self, path):
+        return pygame.mixer.Sound(buffer = self.view(path))
+
+    # Method to write a cache file - "images" maps source paths to surfaces, "sounds" maps them to raw samples
+    @staticmethod
+    def write(path, sourcesHash, images, sounds):
+        entries = []
+
+        for image_path, image in images.items():
+            entries.append((image_path, {"kind": "image", "size": image.get_size()}, pygame.image.tobytes(image, PIXEL_FORMAT)))
+
+        for sound_path, samples in sounds.items():
+            entries.append((sound_path, {"kind": "sound"}, samples))
+
+        # Place every buffer after the index, aligned - Offsets change the index's size, so repeat until it fits
+        header_size = struct.calcsize(HEADER_FORMAT)
+        index_space = 0
+
+        while True:
+            index = {}
+            offset = header_size + index_space
+            offset += paddingFor(offset)
+
+            for entry_path, entry, data in entries:
+                index[entry_path] = dict(entry, offset = offset, length = len(data))
+                offset += len(data) + paddingFor(len(data))
+
+            index_bytes = json.dumps(index).encode()
+
+            if len(index_bytes) <= index_space:
+                break
+
+            index_space = len(index_bytes)
+
+        # Write to a temporary file first, so a running game never maps a half-written cache
+        os.makedirs(os.path.dirname(path) or ".", exist_ok = True)
+        temporary_path = f"{path}.tmp"
+
+        with open(temporary_path, "wb") as file:
+            file.write(struct.pack(HEADER_FORMAT, CACHE_MAGIC, CACHE_VERSION, sourcesHash, len(index_bytes)))
+            file.write(index_bytes)
+
+            for entry_path, entry, data in entries:
+                file.seek(index[entry_path]["offset"])
+                file.write(data)
+
+        os.replace(temporary_path, path)
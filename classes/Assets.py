@@ -0,0 +1,219 @@
+import pygame
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from classes.TextureAtlas import TextureAtlas
+from classes.AssetCache import AssetCache, sourcesHash
+
+# List of every file the game loads, relative to the static folder
+STATIC_PATH = "static"
+MANIFEST_PATH = f"{STATIC_PATH}/manifest.json"
+
+LOADING_THREADS = 4
+
+# Decoded images and sounds, rebuilt whenever a source file changes
+CACHE_PATH = "cache/assets.bin"
+
+# Function to read the asset manifest
+def loadManifest(path = MANIFEST_PATH):
+    with open(path) as file:
+        return json.load(file)
+
+# Function to decode a sound effect - Returns None if it can't be loaded
+def loadSound(key, path, decode = pygame.mixer.Sound):
+    try:
+        return decode(path)
+    except Exception as e:
+        print(f"Error loading sound '{key}' from {path}: {e}")
+
+# Function to start a job for every path of a (nested) manifest entry - Returns the same structure with the jobs in place of the paths
+def submitAll(executor, entry, load, jobs):
+    if isinstance(entry, dict):
+        return {key: submitAll(executor, value, load, jobs) for key, value in entry.items()}
+
+    if isinstance(entry, list):
+        return [submitAll(executor, value, load, jobs) for value in entry]
+
+    path = f"{STATIC_PATH}/{entry}"
+    jobs[path] = executor.submit(load, path)
+
+    return jobs[path]
+
+# Returns the path of every file in a (nested) manifest entry
+def pathsIn(entry):
+    if isinstance(entry, dict):
+        return [path for value in entry.values() for path in pathsIn(value)]
+
+    if isinstance(entry, list):
+        return [path for value in entry for path in pathsIn(value)]
+
+    return [f"{STATIC_PATH}/{entry}"]
+
+# Function to replace every job of a structure built by submitAll with its result - Waits for the unfinished ones
+def resultsOf(entry):
+    if isinstance(entry, dict):
+        return {key: resultsOf(value) for key, value in entry.items()}
+
+    if isinstance(entry, list):
+        return [resultsOf(value) for value in entry]
+
+    return entry.result()
+
+# Transformations that create sprite variants from the loaded images
+def mirrored(image):
+    return pygame.transform.flip(image, True, False)
+
+def upsideDown(image):
+    return pygame.transform.rotate(image, 180)
+
+class Assets:
+    # Constructor for Assets class - Images and sounds are decoded on a thread pool, or taken from the cache
+    # With "wait" the constructor returns once everything is loaded, otherwise call finishImages and update when they are ready
+    def __init__(self, loadSounds = True, wait = True, useCache = True):
+        self.images = {}
+        self.sounds = {}
+        self.atlas = None
+
+        self.manifest = loadManifest()
+        self.sound_paths = {key: f"{STATIC_PATH}/{path}" for key, path in self.manifest["sounds"].items()}
+        self.load_sounds = loadSounds
+
+        # Use the decoded files of a previous launch if none of the sources changed since
+        self.cache = None
+        self.cache_hash = None
+
+        if useCache:
+            self.cache_hash = sourcesHash(pathsIn(self.manifest["images"]) + list(self.sound_paths.values()))
+            self.cache = AssetCache.open(CACHE_PATH, self.cache_hash)
+
+        load_image = self.cache.image if self.cache else pygame.image.load
+        decode_sound = self.cache.sound if self.cache else pygame.mixer.Sound
+
+        # Startup timing, in seconds since the loading started
+        self.start_time = time.perf_counter()
+        self.images_time = None
+        self.sounds_time = None
+
+        # Images go first in the queue, the game can't start without them
+        executor = ThreadPoolExecutor(LOADING_THREADS)
+        self.critical_jobs = {}
+        self.image_jobs = submitAll(executor, self.manifest["images"], load_image, self.critical_jobs)
+
+        # Headless simulations don't need any audio
+        self.sound_jobs = {}
+
+        if loadSounds:
+            for key, path in self.sound_paths.items():
+                self.sound_jobs[key] = executor.submit(loadSound, key, path, decode_sound)
+
+        # Queued jobs still run, the threads just go away once they are done
+        executor.shutdown(wait = False)
+
+        if wait:
+            self.finishImages()
+
+            for job in self.sound_jobs.values():
+                job.result()
+
+            self.update()
+
+    # Returns how much of the images needed to start the game are loaded, from 0 to 1
+    def progress(self):
+        return sum(job.done() for job in self.critical_jobs.values()) / len(self.critical_jobs) if self.critical_jobs else 1
+
+    # Returns True once every image is decoded
+    def imagesReady(self):
+        return all(job.done() for job in self.critical_jobs.values())
+
+    # Method to put the decoded images in place and create their variants - Waits for the images that are still loading
+    def finishImages(self):
+        self.images = resultsOf(self.image_jobs)
+        self.createVariants()
+
+        self.images_time = time.perf_counter() - self.start_time
+
+    # Method to store the sound effects that finished decoding - Returns the keys of the sounds that arrived
+    def update(self):
+        arrived = [key for key, job in self.sound_jobs.items() if job.done()]
+
+        for key in arrived:
+            sound = self.sound_jobs.pop(key).result()
+
+            if sound is not None:
+                self.sounds[key] = sound
+
+        if not self.sound_jobs and self.sounds_time is None:
+            self.sounds_time = time.perf_counter() - self.start_time
+
+            # Everything was decoded from the sources, keep the result for the next launch
+            if self.cache is None and self.cache_hash and self.load_sounds:
+                self.saveCache(background = True)
+
+        return arrived
+
+    # Returns True once every image and sound is in place
+    def loaded(self):
+        return self.images_time is not None and self.sounds_time is not None
+
+    # Method to write the decoded images and sounds to the cache file - Returns False unless every file of the manifest loaded
+    def saveCache(self, background = False):
+        if self.images_time is None or len(self.sounds) != len(self.sound_paths):
+            return False
+
+        images = {path: job.result() for path, job in self.critical_jobs.items()}
+        sounds = {self.sound_paths[key]: sound.get_raw() for key, sound in self.sounds.items()}
+        cache_hash = self.cache_hash or sourcesHash(list(images) + list(sounds))
+
+        # The decoded images aren't used after conversion, so they can be read while the game goes on
+        if background:
+            threading.Thread(target = AssetCache.write, args = (CACHE_PATH, cache_hash, images, sounds)).start()
+
+        else:
+            AssetCache.write(CACHE_PATH, cache_hash, images, sounds)
+
+        return True
+
+    # Method to create the rotated and flipped versions of the sprites once, so every player shares them
+    def createVariants(self):
+        player = self.images["player"]
+        right_frames = player["right"]
+
+        # Walking left is walking right mirrored, one frame later in the walk cycle
+        player["left"] = [mirrored(frame) for frame in right_frames[-1:] + right_frames[:-1]]
+
+        # Pluto falls upside down after dying
+        self.images["player_dead"] = {direction: [upsideDown(frame) for frame in frames] for direction, frames in player.items()}
+
+    # Method to convert every image to the display's pixel format and pack the sprites into an atlas - Needs a display mode
+    def convertImages(self):
+        images = self.images
+
+        # The background has no transparency
+        images["background"] = images["background"].convert()
+        images["clouds"] = images["clouds"].convert_alpha()
+
+        # Give every sprite a name in the atlas
+        sprites = {"platform": images["platform"]}
+
+        for group in ("player", "player_dead"):
+            for direction, frames in images[group].items():
+                for i, frame in enumerate(frames):
+                    sprites[f"{group}/{direction}/{i}"] = frame
+
+        for group in ("enemy", "powerup"):
+            for kind, image in images[group].items():
+                sprites[f"{group}/{kind}"] = image
+
+        self.atlas = TextureAtlas(sprites)
+        get = self.atlas.get
+
+        # Replace the loaded images with their views of the atlas
+        for group in ("player", "player_dead"):
+            images[group] = {direction: [get(f"{group}/{direction}/{i}") for i in range(len(frames))] for direction, frames in images[group].items()}
+
+        images["platform"] = get("platform")
+
+        for group in ("enemy", "powerup"):
+            images[group] = {kind: get(f"{group}/{kind}") for kind in images[group]}
@@ -0,0 +1,70 @@
+import pygame
+import random
+
+STAR_FIELD_COLORKEY = (0, 0, 0) # Transparent color of the star field - Stars are never this dark
+
+class BackgroundLayer:
+    # Constructor for BackgroundLayer class - "scrollRate" is how many pixels the layer moves per pixel of camera movement
+    def __init__(self, image, scrollRate, baseY = 0, repeat = False):
+        self.image = image
+        self.scroll_rate = scrollRate
+        self.base_y = baseY
+        self.repeat = repeat # Tile the image vertically forever
+
+        self.visible = True
+
+    # Returns the screen y-coordinate of the layer's top, snapped to whole pixels
+    def position(self, cameraYOffset):
+        return round(self.base_y + cameraYOffset * self.scroll_rate)
+
+    # Method to draw the part of the layer that falls inside "area" (a rect of the screen)
+    def draw(self, surface, cameraYOffset, area):
+        if not self.visible:
+            return
+
+        y = self.position(cameraYOffset)
+
+        if self.repeat:
+            image_height = self.image.get_height()
+
+            # Copy the visible rows in slices, wrapping around the bottom of the image
+            source_y = (area.top - y) % image_height
+            destination_y = area.top
+            remaining = area.height
+
+            while remaining > 0:
+                rows = min(remaining, image_height - source_y)
+                surface.blit(self.image, (area.left, destination_y), pygame.Rect(area.left, source_y, area.width, rows))
+
+                destination_y += rows
+                remaining -= rows
+                source_y = 0
+
+        else:
+            # Only blit the part of the image that is inside the area
+            visible_rect = area.clip(self.image.get_rect(top = y))
+
+            if visible_rect:
+                surface.blit(self.image, visible_rect, visible_rect.move(0, -y))
+
+# Function to draw a tileable field of stars on a transparent surface
+# The stars are opaque and the rest is a color key, so drawing the layer copies the star pixels without blending the whole screen
+def bakeStarField(width, height, starCount, seed = 0):
+    star_field = pygame.Surface((width, height))
+    rng = random.Random(seed) # Always the same sky, without touching the game's random streams
+
+    for _ in range(starCount):
+        position = (rng.randrange(width), rng.randrange(height))
+        brightness = rng.randint(60, 200) # A faint star is a darker gray instead of a transparent white, the sky behind it is nearly black
+        radius = 1 if rng.random() < 0.85 else 2
+
+        pygame.draw.circle(star_field, (brightness, brightness, brightness), position, radius)
+
+    # Convert it once if there is a display to convert to
+    if pygame.display.get_surface():
+        star_field = star_field.convert()
+
+    # Run-length encoding skips the transparent pixels in blocks
+    star_field.set_colorkey(STAR_FIELD_COLORKEY, pygame.RLEACCEL)
+
+    return star_field
@@ -5,19 +5,18 @@ BLUE = (30, 30, 255)
 LIGHT_BLUE = (70, 70, 255)
 WHITE = (255, 255, 255)
 
-# Default font
-pygame.font.init()
-button_font = pygame.font.SysFont("calibri, helvetica, arial", 25, bold = True)
+# Size of pygame's default font, used when no font is given
+DEFAULT_FONT_SIZE = 25
 
 class Button:
     # Constructor for Button class
-    def __init__(self, text, x, y, callback, shortcutKeys=[], width=200, height=50, borderRadius=7, font=button_font, color=WHITE, backgroundColor=LIGHT_BLUE, hoverColor=BLUE):
+    def __init__(self, text, x, y, callback, shortcutKeys=[], width=200, height=50, borderRadius=7, font=None, color=WHITE, backgroundColor=LIGHT_BLUE, hoverColor=BLUE):
         self.text = text
         self.x = x
         self.y = y
         self.width = width
         self.height = height
-        self.font = font
+        self.font = font or pygame.font.Font(None, DEFAULT_FONT_SIZE)
         self.color = color
         self.background_color = backgroundColor
         self.hover_color = hoverColor
@@ -26,12 +25,10 @@ class Button:
         self.shortcuts = shortcutKeys
         self.hovered = False
 
-    # Method to draw the button on the screen
+    # Method to draw the button on the screen - Clicks and shortcuts are handled by handleEvent
     def draw(self, surface):
         # Mouse controls
-        mouse = pygame.mouse.get_pos()
-        click = pygame.mouse.get_pressed()[0] == 1
-        mouseIsHovering = self.x < mouse[0] < self.x + self.width and self.y < mouse[1] < self.y + self.height
+        mouseIsHovering = self.isUnder(pygame.mouse.get_pos())
 
         # Set button's color
         current_color = self.hover_color if mouseIsHovering else self.background_color
@@ -53,18 +50,9 @@ class Button:
             pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
             self.hovered = True
 
-        # Check if the button has been clicked
-        clicked = click and mouseIsHovering
-
-        # Check if a shortcut has been used
-        shortcut_used = self.checkShortcuts()
-
-        if clicked or shortcut_used:
-            # Reset cursor icon
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-
-            # Execute button's callback function
-            self.callback()
+    # Returns True if "position" is inside the button
+    def isUnder(self, position):
+        return self.x < position[0] < self.x + self.width and self.y < position[1] < self.y + self.height
 
     # Method to draw a rectangle with rounded corners
     def drawRoundedRectangle(self, surface, color):
@@ -81,7 +69,17 @@ class Button:
         pygame.draw.circle(surface, color, (self.x + self.border_radius, self.y + self.height - self.border_radius), self.border_radius)
         pygame.draw.circle(surface, color, (self.x + self.width - self.border_radius, self.y + self.height - self.border_radius), self.border_radius)
 
-    # Method to check if a button's shortcut key has been pressed
-    def checkShortcuts(self):
-        keys = pygame.key.get_pressed()
-        return any(keys[key] for key in self.shortcuts)
\ No newline at end of file
+    # Method to run the callback when an event clicks the button or presses one of its shortcut keys
+    # Every press is a single event, so it runs the callback once
+    def handleEvent(self, event):
+        clicked = event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.isUnder(event.pos)
+        shortcut_used = event.type == pygame.KEYDOWN and event.key in self.shortcuts
+
+        if clicked or shortcut_used:
+            # Reset cursor icon
+            if self.hovered:
+                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                self.hovered = False
+
+            # Execute button's callback function
+            self.callback()
@@ -1,39 +1,174 @@
 import json
 import os
+import queue
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+
+DATABASE_PATH = "database/pluto.db"
+LEGACY_PATH = "database/data.json" # High score file of older versions, imported once
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    played_at TEXT NOT NULL, -- UTC time the run ended
+    day TEXT NOT NULL, -- Local date the run ended, for per-day queries
+    score INTEGER NOT NULL,
+    duration REAL NOT NULL, -- Seconds of game time
+    seed INTEGER,
+    powerups_collected INTEGER NOT NULL DEFAULT 0,
+    cause_of_death TEXT -- "enemy", "fell" or "quit"
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_by_day ON runs (day, score DESC);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+"""
 
 class Database:
-    # Constructor for Database class
-    def __init__(self, path="database/data.json"):
+    # Constructor for Database class - Writes are done by a background thread, so saving never makes the game wait
+    def __init__(self, path=DATABASE_PATH, legacyPath=LEGACY_PATH):
         self.path = path
-        self.data = {}
-        self._load()
+        self.high_score = 0
+
+        # Writes waiting for the writer thread - None tells it to stop
+        self.writes = queue.Queue()
+        self.writer = None
 
-    # Private method to load data from file
-    def _load(self):
         try:
-            with open(self.path, 'r') as file:
-                self.data = json.load(file)
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True) # "exist_ok" to not raise an error if the directory already exists
+
+            connection = self._connect()
+            connection.executescript(SCHEMA)
+            self._migrate(connection, legacyPath)
+            self.high_score = self._readHighScore(connection)
+            connection.close()
+
+        except sqlite3.Error as error:
+            print(f"Error opening database {self.path}: {error}")
+            return
+
+        self.writer = threading.Thread(target=self._writeLoop, daemon=True) # "daemon" so a stuck disk never keeps the game open
+        self.writer.start()
+
+    # Private method to open a connection - Every thread needs its own
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.row_factory = sqlite3.Row
+
+        # Readers don't block the writer and the writer doesn't block readers - Commits only sync the log, not the whole file
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
 
-        except IOError as error:
-            print(f"Error loading data from {self.path}: {error}")
-            self.data = {}
+        return connection
+
+    # Private method to import the high score of the JSON file used by older versions, only once
+    def _migrate(self, connection, legacyPath):
+        if connection.execute("SELECT 1 FROM meta WHERE key = 'legacy_migrated'").fetchone():
+            return
+
+        high_score = 0
 
-    # Private method to save data to file
-    def _save(self):
         try:
-            os.makedirs(os.path.dirname(self.path), exist_ok=True) # "exist_ok" to not raise an error if the directory already exists
+            with open(legacyPath, 'r') as file:
+                high_score = json.load(file).get("high_score", 0)
+
+            print(f"Imported high score {high_score} from {legacyPath}")
+
+        except FileNotFoundError:
+            pass
 
-            with open(self.path, 'w') as file:
-                json.dump(self.data, file, indent=4) # "indent" to make the file more readable
-                
-        except IOError as error:
-            print(f"Error saving data to {self.path}: {error}")
+        except (IOError, ValueError, AttributeError) as error:
+            print(f"Error importing data from {legacyPath}: {error}")
+
+        # The flag and the score are saved together, or not at all
+        with connection:
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('high_score', MAX(?, COALESCE((SELECT value FROM meta WHERE key = 'high_score'), 0)))", (high_score,))
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_migrated', 1)")
+
+    # Private method to read the best score of every run and of the imported high score
+    def _readHighScore(self, connection):
+        row = connection.execute("SELECT MAX(COALESCE((SELECT MAX(score) FROM runs), 0), COALESCE((SELECT value FROM meta WHERE key = 'high_score'), 0))").fetchone()
+
+        return row[0]
+
+    # Private method run by the writer thread - Everything queued at once is saved in a single transaction
+    def _writeLoop(self):
+        try:
+            connection = self._connect()
+        except sqlite3.Error as error:
+            print(f"Error opening database {self.path}: {error}")
+            return
+
+        running = True
+
+        while running:
+            writes = [self.writes.get()]
+
+            while not self.writes.empty():
+                writes.append(self.writes.get())
+
+            if None in writes:
+                running = False
+                writes = [write for write in writes if write is not None]
+
+            try:
+                with connection:
+                    for statement, parameters in writes:
+                        connection.execute(statement, parameters)
+
+            except sqlite3.Error as error:
+                print(f"Error saving data to {self.path}: {error}")
+
+        connection.close()
+
+    # Private method to queue a write for the writer thread
+    def _write(self, statement, parameters):
+        if self.writer is None:
+            print(f"Error saving data to {self.path}: the database isn't open")
+            return
+
+        self.writes.put((statement, parameters))
 
     # Public method to get the high score from the database
     def getHighScore(self):
-        return self.data.get("high_score", 0) # If high_score doesn't exist, default to 0
+        return self.high_score
 
     # Public method to set the high score in the database
     def setHighScore(self, score):
-        self.data["high_score"] = score
-        self._save()
\ No newline at end of file
+        self.high_score = max(self.high_score, score)
+        self._write("INSERT OR REPLACE INTO meta (key, value) VALUES ('high_score', ?)", (self.high_score,))
+
+    # Public method to save a finished run - "duration" is in seconds of game time
+    def recordRun(self, score, duration, seed=None, powerupsCollected=0, causeOfDeath=None):
+        self.high_score = max(self.high_score, score)
+        self._write(
+            "INSERT INTO runs (played_at, day, score, duration, seed, powerups_collected, cause_of_death) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (datetime.now(timezone.utc).isoformat(timespec="seconds"), date.today().isoformat(), score, duration, seed, powerupsCollected, causeOfDeath),
+        )
+
+    # Public method to get the best runs, best first
+    def topRuns(self, count=10):
+        connection = self._connect()
+        runs = [dict(row) for row in connection.execute("SELECT * FROM runs ORDER BY score DESC LIMIT ?", (count,))]
+        connection.close()
+
+        return runs
+
+    # Public method to get the number of runs and the best score of every day, most recent first
+    def runsPerDay(self, days=30):
+        connection = self._connect()
+        rows = [dict(row) for row in connection.execute("SELECT day, COUNT(*) AS runs, MAX(score) AS best_score FROM runs GROUP BY day ORDER BY day DESC LIMIT ?", (days,))]
+        connection.close()
+
+        return rows
+
+    # Public method to save everything still queued and stop the writer thread
+    def close(self):
+        if self.writer:
+            self.writes.put(None)
+            self.writer.join(timeout=5)
+            self.writer = None
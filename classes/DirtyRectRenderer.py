@@ -0,0 +1,48 @@
+import pygame
+
+from classes.Renderer import Renderer
+
+class DirtyRectRenderer(Renderer):
+    # Constructor for DirtyRectRenderer class
+    def __init__(self, surface, images, font, fontMargin = 20):
+        super().__init__(surface, images, font, fontMargin)
+
+        # Areas drawn on the previous frame, they have to be restored from the background
+        self.previous_rects = []
+
+        # Background and camera positions of the previous frame
+        self.last_scroll = None
+        self.full_redraw = True
+
+    # Method to draw everything that goes behind the game objects - Only the dirty areas unless the view scrolled
+    def drawBackgroundLayers(self, cameraYOffset):
+        self.updateBackgroundYPosition(cameraYOffset)
+
+        # Everything on the screen moves when the background or the camera scroll
+        scroll = (round(self.background_y_position), round(cameraYOffset))
+
+        if scroll != self.last_scroll:
+            self.full_redraw = True
+            self.last_scroll = scroll
+
+        if self.full_redraw:
+            self.blitBackgroundLayers(cameraYOffset)
+
+        else:
+            for rect in self.previous_rects:
+                self.blitBackgroundLayers(cameraYOffset, rect)
+
+    # Method to show the frame that was just drawn - Only the areas that changed are sent to the display
+    def present(self):
+        if self.full_redraw:
+            pygame.display.flip()
+
+        else:
+            pygame.display.update(self.previous_rects + self.drawn_rects)
+
+        self.previous_rects = self.drawn_rects
+        self.full_redraw = False
+
+    # Method to make sure the next frame is drawn completely
+    def invalidate(self):
+        self.full_redraw = True
@@ -0,0 +1,36 @@
+from collections import OrderedDict
+
+class EffectCache:
+    # Constructor for EffectCache class - Keeps at most "maxSize" pre-rendered surfaces
+    def __init__(self, maxSize = 128):
+        self.max_size = maxSize
+        self.surfaces = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    # Returns the surface stored under "key", calling "render" to create it the first time
+    def get(self, key, render):
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            # Mark as most recently used
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+
+            return surface
+
+        surface = render()
+        self.surfaces[key] = surface
+        self.misses += 1
+
+        # Evict the least recently used surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last = False)
+
+        return surface
+
+    # Method to forget every stored surface
+    def clear(self):
+        self.surfaces.clear()
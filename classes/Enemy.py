@@ -2,15 +2,38 @@ import pygame
 import random
 import math
 
+DIRECTIONS = (-1, 1) # 1 for right, -1 for left
+
 class Enemy:
+    # Fixed set of attributes: no per-instance dictionary
+    __slots__ = (
+        "rng", "is_alive", "moving_enemy", "speed", "direction", "x_flying_speed", "y_flying_speed", "sounds",
+        "sprite_left", "sprite_right", "sprite_idle", "current_sprite", "sprite_rect", "width", "height",
+        "min_x_value", "max_x_value", "x", "y", "previous_x", "previous_y", "hitbox", "host",
+    )
+
     # Constructor for Enemy class
-    def __init__(self, sprites, possibleXValues, y, sounds):
+    def __init__(self, sprites, possibleXValues, y, sounds, rng = random):
+        # Rectangles are only created once, recycled enemies reuse them
+        self.sprite_rect = pygame.Rect(0, 0, 0, 0)
+        self.hitbox = pygame.Rect(0, 0, 0, 0)
+
+        self.spawn(sprites, possibleXValues, y, sounds, rng)
+
+    # Method to (re)initialize the enemy - Called by the constructor and when the enemy is recycled
+    def spawn(self, sprites, possibleXValues, y, sounds, rng = random):
+        # Random number generator used for the enemy's behaviour
+        self.rng = rng
+
         self.is_alive = True
+
+        # Platform the enemy stands on - Set by the world that places it
+        self.host = None
         
         # Movement controls
         self.moving_enemy = self.oneInXChances(3) # ~33% chance
-        self.speed = random.random() * 2
-        self.direction = random.choice([-1, 1])  # 1 for right, -1 for left
+        self.speed = self.rng.random() * 2
+        self.direction = self.rng.choice(DIRECTIONS)
 
         # Fly-away controls
         self.x_flying_speed = 0
@@ -26,23 +49,24 @@ class Enemy:
 
         # Set current sprite and initialize sprite rectangle
         self.current_sprite = (self.sprite_right if self.direction == 1 else self.sprite_left) if self.moving_enemy else self.sprite_idle
-        self.sprite_rect = self.current_sprite.get_rect(y = -500) # -500 to make sure the enemy appears out of the screen
+        sprite_width, sprite_height = self.current_sprite.get_size()
+        self.sprite_rect.update(0, -500, sprite_width, sprite_height) # -500 to make sure the enemy appears out of the screen
 
         # Enemy's dimensions
-        self.width = self.sprite_rect.width
-        self.height = self.sprite_rect.height - 2
+        self.width = sprite_width
+        self.height = sprite_height - 2
         
         # Enemy's initial coordinates
         self.min_x_value = possibleXValues[0]
         self.max_x_value = possibleXValues[1] - self.width
-        self.x = random.randint(self.min_x_value + 10, self.max_x_value)
+        self.x = self.rng.randint(self.min_x_value + 10, self.max_x_value)
         self.y = y - self.height  # Adjust y to ensure it's shown on top of the surface it was placed on
 
         # Initialize enemy's hitbox
-        self.hitbox = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.hitbox.update(self.x, self.y, self.width, self.height)
 
     # Method that gets called every frame
-    def tick(self, windowWidth, windowHeight, frameRateFactor):
+    def tick(self, windowWidth, windowHeight, frameRateFactor = 1):
         self.updateHitbox()
         
         if not self.is_alive: self.flyAway(windowWidth, windowHeight)
@@ -72,7 +96,7 @@ class Enemy:
 
     # There is one in {argument} chances the method returns True
     def oneInXChances(self, x):
-        return random.randint(1, 100) <= 100 / x
+        return self.rng.randint(1, 100) <= 100 / x
     
     # Method to call when the enemy is hit with the invincibility power-up active
     def die(self, playerFeetCoordinates):
@@ -96,6 +120,15 @@ class Enemy:
 
             # Update enemy's state
             self.is_alive = False
+            self.leaveHost()
+
+    # Method to take the enemy off its platform, so the platform no longer has an enemy
+    def leaveHost(self):
+        # The platform may have been recycled with another enemy since
+        if self.host is not None and self.host.enemy is self:
+            self.host.enemy = None
+
+        self.host = None
 
     # Method that makes the enemy fly away
     def flyAway(self, windowWidth, windowHeight):
@@ -0,0 +1,123 @@
+import numpy as np
+
+# Per-entity values, one array each - Hitboxes are stored as offsets from the entity's position plus a size
+FLOAT_FIELDS = (
+    "x", "y", "speed", "direction", "min_x", "max_x", "x_flying_speed", "y_flying_speed",
+    "box_left", "box_top", "box_width", "box_height", "hitbox_x", "hitbox_y", "hitbox_width", "hitbox_height",
+)
+BOOL_FIELDS = ("active", "moving", "alive")
+
+class EntityArrays:
+    # Constructor for EntityArrays class - Stores the state of many entities of one type in parallel NumPy arrays
+    def __init__(self, capacity = 64):
+        self.capacity = 0
+        self.entities = [] # Entity object stored in every slot, None for free slots
+        self.slots = {} # Slot of every stored entity
+        self.free_slots = []
+
+        for name in FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0))
+
+        for name in BOOL_FIELDS:
+            setattr(self, name, np.zeros(0, dtype = bool))
+
+        self.grow(capacity)
+
+    # Returns the number of stored entities
+    def __len__(self):
+        return len(self.slots)
+
+    # Method to make room for "capacity" entities, keeping the stored ones
+    def grow(self, capacity):
+        for name in FLOAT_FIELDS + BOOL_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype = old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+
+        self.entities.extend([None] * (capacity - self.capacity))
+
+        # Lowest slots are handed out first
+        self.free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.free_slots.sort(reverse = True)
+
+        self.capacity = capacity
+
+    # Method to store an entity - "box" is its hitbox as (left offset, top offset, width, height)
+    def add(self, entity, box, moving = False, speed = 0, direction = 0, minX = 0, maxX = 0):
+        if not self.free_slots:
+            self.grow(self.capacity * 2)
+
+        slot = self.free_slots.pop()
+        self.entities[slot] = entity
+        self.slots[entity] = slot
+
+        self.x[slot] = entity.x
+        self.y[slot] = entity.y
+        self.speed[slot] = speed
+        self.direction[slot] = direction
+        self.min_x[slot] = minX
+        self.max_x[slot] = maxX
+        self.x_flying_speed[slot] = 0
+        self.y_flying_speed[slot] = 0
+        self.box_left[slot], self.box_top[slot], self.box_width[slot], self.box_height[slot] = box
+
+        # Start from the hitbox the entity was created with, it's refreshed on the next update
+        self.hitbox_x[slot], self.hitbox_y[slot], self.hitbox_width[slot], self.hitbox_height[slot] = entity.hitbox
+
+        self.active[slot] = True
+        self.moving[slot] = moving
+        self.alive[slot] = True
+
+        return slot
+
+    # Method to forget an entity and free its slot
+    def remove(self, entity):
+        slot = self.slots.pop(entity)
+
+        self.entities[slot] = None
+        self.active[slot] = False
+        self.free_slots.append(slot)
+
+    # Method to forget every entity
+    def clear(self):
+        for entity in list(self.slots):
+            self.remove(entity)
+
+    # Method to recompute every hitbox from the current positions - Truncated to whole pixels, like pygame's rectangles
+    def refreshHitboxes(self):
+        np.trunc(self.x + self.box_left, out = self.hitbox_x)
+        np.trunc(self.y + self.box_top, out = self.hitbox_y)
+        np.trunc(self.box_width, out = self.hitbox_width)
+        np.trunc(self.box_height, out = self.hitbox_height)
+
+    # Method to copy every hitbox into its entity object and place its sprite rectangle for "cameraYOffset", as the entities' tick methods do
+    def syncRects(self, cameraYOffset):
+        slots = np.flatnonzero(self.active)
+        columns = (self.x[slots], self.y[slots], self.hitbox_x[slots], self.hitbox_y[slots], self.hitbox_width[slots], self.hitbox_height[slots])
+
+        for slot, x, y, hitbox_x, hitbox_y, hitbox_width, hitbox_height in zip(slots.tolist(), *(column.tolist() for column in columns)):
+            entity = self.entities[slot]
+            entity.sprite_rect.update(x, y + cameraYOffset, entity.width, entity.height)
+            entity.hitbox.update(hitbox_x, hitbox_y, hitbox_width, hitbox_height)
+
+    # Returns a mask of the alive entities whose hitbox overlaps "rect"
+    def overlapping(self, rect):
+        return (
+            self.active & self.alive
+            & (self.hitbox_x < rect.right) & (rect.left < self.hitbox_x + self.hitbox_width)
+            & (self.hitbox_y < rect.bottom) & (rect.top < self.hitbox_y + self.hitbox_height)
+        )
+
+    # Returns every entity's horizontal speed, signed by its direction
+    def velocity(self):
+        return self.speed * self.direction
+
+    # Method to move the entities in "mask" along their direction - Returns the slots that went past their bounds and turned around
+    def move(self, mask):
+        self.x[mask] += self.velocity()[mask]
+
+        turned = mask & ((self.x < self.min_x) | (self.x > self.max_x))
+        self.direction[turned] *= -1
+
+        return np.flatnonzero(turned)
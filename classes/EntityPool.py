@@ -0,0 +1,28 @@
+class EntityPool:
+    # Constructor for EntityPool class - Keeps at most "capacity" unused entities ready to be recycled
+    def __init__(self, entityClass, capacity = 16):
+        self.entity_class = entityClass
+        self.capacity = capacity
+        self.free = []
+
+        # Statistics
+        self.created = 0
+        self.reused = 0
+
+    # Returns an entity initialized with the given arguments, recycling an unused one if possible
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            entity = self.free.pop()
+            entity.spawn(*args, **kwargs)
+            self.reused += 1
+
+        else:
+            entity = self.entity_class(*args, **kwargs)
+            self.created += 1
+
+        return entity
+
+    # Method to give back an entity that is no longer in the world
+    def release(self, entity):
+        if len(self.free) < self.capacity:
+            self.free.append(entity)
@@ -0,0 +1,47 @@
+import pygame
+
+class FontManager:
+    # Constructor for FontManager class - "path" is a font file to use instead of looking for "family" on the system
+    def __init__(self, family, path = None):
+        self.family = family
+        self.path = path
+
+        # Font files, found the first time a font is needed
+        self.regular_path = None
+        self.bold_path = None
+        self.resolved = False
+
+        # Fonts already created, keyed by size and boldness
+        self.fonts = {}
+
+    # Method to find the font files once - Scanning the system's fonts can take a while
+    def resolve(self):
+        if self.path:
+            self.regular_path = self.bold_path = self.path
+
+        else:
+            # None means pygame's default font
+            self.regular_path = pygame.font.match_font(self.family)
+            self.bold_path = pygame.font.match_font(self.family, bold = True)
+
+        self.resolved = True
+
+    # Returns the font with the given size, created only the first time
+    def get(self, size, bold = False):
+        key = (size, bold)
+        font = self.fonts.get(key)
+
+        if font is None:
+            if not self.resolved:
+                self.resolve()
+
+            path = self.bold_path if bold else self.regular_path
+            font = pygame.font.Font(path, size)
+
+            # Make the letters bold if the family has no bold file, like pygame.font.SysFont does
+            if bold and (path is None or path == self.regular_path):
+                font.set_bold(True)
+
+            self.fonts[key] = font
+
+        return font
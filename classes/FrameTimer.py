@@ -0,0 +1,162 @@
+import pygame
+import csv
+import math
+import time
+from collections import deque
+
+# Phases of a frame, in the order they happen - Every mark adds the time since the previous mark to a phase
+PHASES = (
+    "wait", # clock.tick sleeping until the frame's turn
+    "events", # Event loop and keyboard state
+    "spawning", # Creating and removing platforms, enemies and power-ups
+    "pluto", # pluto.tick and the movement controls
+    "entities", # Updating the objects and checking their collisions
+    "background", # Background and parallax layers
+    "sprites", # Queuing platforms, enemies, power-ups and pluto
+    "effects", # Power-up effects
+    "hud", # Score texts
+    "blits", # Sending the render queue to the screen
+    "flip", # display.flip or display.update
+)
+
+# Latencies measured over several phases or frames - Not part of the frame's total
+LATENCIES = (
+    "input", # From reading the keyboard to the end of the flip showing the last step it was used for
+    "input_worst", # Same, from the previous time the keyboard was read - The longest a key press can wait to be seen
+)
+
+WINDOW_SIZE = 180 # Frames used for the averages and percentiles, 4 seconds at 45 fps
+OVERLAY_REFRESH = 15 # Frames between two redraws of the overlay, so the numbers can be read
+OVERLAY_PADDING = 8
+OVERLAY_COLUMNS = (90, 140, 190) # Right edges of the average, p95 and p99 columns
+
+# Color RGB codes
+WHITE = (255, 255, 255)
+GRAY = (160, 160, 160)
+OVERLAY_BACKGROUND = (0, 0, 0, 170)
+
+# Returns the value below which "fraction" of the sorted values are - Nearest rank method
+def percentile(sortedValues, fraction):
+    return sortedValues[max(math.ceil(fraction * len(sortedValues)) - 1, 0)]
+
+class FrameTimer:
+    # Constructor for FrameTimer class - With "csvPath" the timings of every frame are written to that file
+    # "values" are the names of other numbers written next to the timings, like the quality level
+    def __init__(self, csvPath = None, windowSize = WINDOW_SIZE, values = ()):
+        # Seconds spent in every phase of the current frame
+        self.current = dict.fromkeys(PHASES, 0)
+        self.last_mark = time.perf_counter()
+        self.frame_count = 0
+
+        # Seconds the last frame spent working, without waiting for the next one
+        self.busy_time = 0
+
+        self.values = dict.fromkeys(values, 0)
+
+        # Timings of the last frames, in seconds
+        self.history = {phase: deque(maxlen = windowSize) for phase in PHASES + ("total",) + LATENCIES}
+        self.latencies = dict.fromkeys(LATENCIES, 0)
+
+        # Overlay showing the timings, redrawn every few frames
+        self.overlay = None
+        self.overlay_frame = None
+
+        self.csv_file = None
+        self.csv_writer = None
+
+        if csvPath:
+            try:
+                self.csv_file = open(csvPath, "w", newline = "")
+                self.csv_writer = csv.writer(self.csv_file)
+                self.csv_writer.writerow(("frame",) + tuple(f"{phase}_ms" for phase in PHASES) + ("total_ms",) + tuple(f"{name}_latency_ms" for name in LATENCIES) + tuple(self.values))
+            except Exception as e:
+                print(f"Error opening frame timings file {csvPath}: {e}")
+
+    # Method to add the time since the previous mark to a phase of the current frame
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.current[phase] += now - self.last_mark
+        self.last_mark = now
+
+    # Method to start timing again from now - The time since the last mark isn't part of any frame
+    def restart(self):
+        self.current = dict.fromkeys(PHASES, 0)
+        self.last_mark = time.perf_counter()
+
+    # Method to set one of the latencies of the current frame, in seconds
+    def measure(self, name, seconds):
+        self.latencies[name] = seconds
+
+    # Method to change one of the values written next to the timings
+    def setValue(self, name, value):
+        self.values[name] = value
+
+    # Method to store the timings of the current frame and start the next one
+    def endFrame(self):
+        frame = self.current
+        total = sum(frame.values())
+        self.busy_time = total - frame["wait"]
+
+        for phase, seconds in frame.items():
+            self.history[phase].append(seconds)
+
+        self.history["total"].append(total)
+
+        for name, seconds in self.latencies.items():
+            self.history[name].append(seconds)
+
+        if self.csv_writer:
+            self.csv_writer.writerow([self.frame_count] + [f"{frame[phase] * 1000:.3f}" for phase in PHASES] + [f"{total * 1000:.3f}"] +
+                                     [f"{self.latencies[name] * 1000:.3f}" for name in LATENCIES] + list(self.values.values()))
+
+        self.frame_count += 1
+        self.current = dict.fromkeys(PHASES, 0)
+
+    # Returns the average, 95th and 99th percentile of a phase over the last frames, in milliseconds
+    def statistics(self, phase):
+        values = sorted(self.history[phase])
+
+        if not values:
+            return 0, 0, 0
+
+        return sum(values) / len(values) * 1000, percentile(values, 0.95) * 1000, percentile(values, 0.99) * 1000
+
+    # Returns a surface with a table of the statistics of every phase
+    def overlaySurface(self, font):
+        if self.overlay is not None and self.frame_count - self.overlay_frame < OVERLAY_REFRESH:
+            return self.overlay
+
+        rows = [("ms", "avg", "p95", "p99")]
+
+        for phase in PHASES + ("total",) + LATENCIES:
+            rows.append((phase,) + tuple(f"{value:.2f}" for value in self.statistics(phase)))
+
+        for name, value in self.values.items():
+            rows.append((name, str(value)))
+
+        line_height = font.get_linesize()
+        overlay = pygame.Surface((OVERLAY_COLUMNS[-1] + OVERLAY_PADDING * 2, line_height * len(rows) + OVERLAY_PADDING * 2), pygame.SRCALPHA)
+        overlay.fill(OVERLAY_BACKGROUND)
+
+        for i, row in enumerate(rows):
+            y = OVERLAY_PADDING + i * line_height
+            color = GRAY if i == 0 else WHITE
+
+            # Phase names on the left, numbers aligned to the right of their columns
+            overlay.blit(font.render(row[0], True, color), (OVERLAY_PADDING, y))
+
+            for text, right in zip(row[1:], OVERLAY_COLUMNS):
+                text_surface = font.render(text, True, color)
+                overlay.blit(text_surface, (OVERLAY_PADDING + right - text_surface.get_width(), y))
+
+        self.overlay = overlay
+        self.overlay_frame = self.frame_count
+
+        return overlay
+
+    # Method to write the remaining timings to the file
+    def close(self):
+        if self.csv_file:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
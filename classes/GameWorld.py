@@ -0,0 +1,352 @@
+import pygame
+import random
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import islice
+
+from classes.Player import Player
+from classes.Platform import Platform, DEFAULT_DIFFICULTY
+from classes.Enemy import Enemy
+from classes.PowerUp import PowerUp
+from classes.EntityPool import EntityPool
+
+# Constants
+WINDOW_WIDTH = 500
+WINDOW_HEIGHT = 800
+NORMAL_FRAME_RATE = 45 # The simulation always runs at this rate, no matter how fast the game is rendered
+
+PLATFORM_CENTER_OFFSET = 7
+PLATFORM_GAP = 200
+PADDING = 20
+POOL_CAPACITY = 16 # Unused entities kept for recycling, per type
+COLLISION_MARGIN = 60 # Extra distance above and below pluto's hitbox where platforms and the objects on them can touch it
+
+# Inputs the simulation reads every frame
+INPUT_NAMES = ("left", "right", "jump", "invincibility", "double_points", "score_boost")
+
+# Returns the world class for a simulation backend - "numpy" batches the entity updates, "objects" updates one object at a time
+def worldClass(backend = "objects"):
+    if backend == "numpy":
+        try:
+            from classes.ArrayGameWorld import ArrayGameWorld
+            return ArrayGameWorld
+
+        except ImportError as e:
+            print(f"Error loading the numpy backend ({e}), using the objects backend instead")
+
+    return GameWorld
+
+class GameWorld:
+    # Constructor for GameWorld class
+    def __init__(self, images, sounds = {}, seed = None):
+        self.images = images
+        self.sounds = sounds
+
+        # Ring buffers with the game objects, from the bottom to the top of the level - They only ever leave from the bottom
+        self.platforms = deque()
+        self.enemies = deque()
+        self.powerups = deque()
+
+        # Objects that left the world, ready to be recycled
+        self.platform_pool = EntityPool(Platform, POOL_CAPACITY)
+        self.enemy_pool = EntityPool(Enemy, POOL_CAPACITY)
+        self.powerup_pool = EntityPool(PowerUp, POOL_CAPACITY)
+
+        # Optional FrameTimer that measures the phases of every step
+        self.timer = None
+
+        # Chances of enemies, power-ups and moving platforms - See classes/Platform.py
+        self.difficulty = DEFAULT_DIFFICULTY
+
+        self.reset(seed)
+
+    # Method to put the world back in its initial state - A random seed is picked if none is given
+    def reset(self, seed = None):
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+
+        # Independent random streams, so the level is the same no matter how entities behave
+        self.level_random = random.Random(f"{self.seed}-level")
+        self.entity_random = random.Random(f"{self.seed}-entity")
+
+        # Player instance
+        self.pluto = Player(self.images["player"], self.sounds, self.images["player_dead"])
+        self.savePreviousPosition(self.pluto)
+
+        # Recycle the previous game's objects
+        self.releaseBottomObjects(float("-inf"))
+
+        # Dictionary to store dynamic variables
+        self.dynamic = {
+            "score": 0,
+            "invincibility": {
+                "active": False,
+                "timer": 0
+            },
+            "double_points": {
+                "active": False,
+                "timer": 0
+            },
+            "score_boost": {
+                "active": False,
+                "timer": 0
+            },
+        }
+
+        # Simulation state
+        self.frame_rate = NORMAL_FRAME_RATE
+        self.frame_count = 0
+        self.is_over = False
+        self.powerups_collected = 0
+
+        # Camera position on the previous step, used to interpolate rendering
+        self.previous_camera_y_offset = 0
+
+    # Method that advances the simulation by one frame - Returns False once the game is over
+    def step(self, inputs):
+        self.frame_count += 1
+        pluto = self.pluto
+
+        # Remember where everything was before this step
+        self.savePreviousState()
+
+        # Cheats: Add 5 points
+        if inputs.get("score_boost"):
+            self.dynamic["score"] += 5
+            self.dynamic["score_boost"]["timer"] = 0.8 * self.frame_rate
+
+        # Manage game objects
+        self.createObjects()
+        self.removeOffScreenObjects()
+
+        if self.timer: self.timer.mark("spawning")
+
+        # Manage power-up effects
+        self.handlePowerups()
+
+        # Update Player instance every frame - Only the platforms around pluto can be landed on
+        landing_platforms = self.platformsNear(pluto.y, pluto.y + pluto.height)
+        pluto.tick(landing_platforms)
+
+        # Check if the player has fallen off the screen
+        if self.playerFell(): self.is_over = True
+
+        # Movement controls
+        if inputs.get("left"):
+            pluto.move(-pluto.speed)
+
+            pluto.current_direction = "left"
+            pluto.current_sprites = pluto.sprites_left
+
+        elif inputs.get("right"):
+            pluto.move(pluto.speed)
+
+            pluto.current_direction = "right"
+            pluto.current_sprites = pluto.sprites_right
+
+        else:
+            pluto.current_direction = "idle"
+            pluto.current_sprites = pluto.sprites_idle
+
+        if inputs.get("jump"):
+            pluto.jump()
+
+        # Cheats: activate invincibility or double points
+        if inputs.get("invincibility"): self.dynamic["invincibility"]["timer"] = 20
+        if inputs.get("double_points"): self.dynamic["double_points"]["timer"] = 30
+
+        if self.timer: self.timer.mark("pluto")
+
+        # Increase score for the platforms touched for the first time - Only the ones pluto could land on may have been touched
+        self.scoreTouchedPlatforms(landing_platforms)
+
+        # Update game objects and check which ones touch pluto
+        self.updateObjects()
+        self.handleCollisions()
+
+        pluto.sprite_rect.update(pluto.x, pluto.y + pluto.camera_y_offset, pluto.width, pluto.height)
+
+        if self.timer: self.timer.mark("entities")
+
+        return not self.is_over
+
+    # Method to give points for every platform in "platforms" touched for the first time
+    def scoreTouchedPlatforms(self, platforms):
+        for platform in platforms:
+            if platform.touched and not platform.hasChangedScore:
+                self.dynamic["score"] += 2 if self.dynamic["double_points"]["active"] else 1
+                platform.hasChangedScore = True
+
+    # Method to move every platform, enemy and power-up one frame forward
+    def updateObjects(self):
+        pluto = self.pluto
+
+        # Update platforms
+        for platform in self.platforms:
+            platform.sprite_rect.update(platform.x, platform.y + pluto.camera_y_offset, platform.width, platform.height)
+
+            # Update Platform instance every frame
+            platform.tick(pluto)
+
+        # Update enemies
+        for enemy in self.enemies:
+            enemy.sprite_rect.update(enemy.x, enemy.y + pluto.camera_y_offset, enemy.width, enemy.height)
+
+            # Update Enemy instance every frame
+            enemy.tick(WINDOW_WIDTH, WINDOW_HEIGHT)
+
+        # Update power-ups
+        for powerup in self.powerups:
+            powerup.sprite_rect.update(powerup.x, powerup.y + pluto.camera_y_offset, powerup.width, powerup.height)
+
+            # Update Power-Up instance every frame
+            powerup.tick()
+
+    # Method to handle enemies and power-ups touching pluto
+    def handleCollisions(self):
+        pluto = self.pluto
+
+        # Enemies and power-ups stay on their platform, so only the ones around pluto can touch it
+        nearby_platforms = self.platformsNear(pluto.hitbox.top, pluto.hitbox.bottom)
+
+        # Handle enemy collision with pluto
+        for platform in nearby_platforms:
+            enemy = platform.enemy
+
+            if enemy and enemy.collidedWith(pluto):
+                if self.dynamic["invincibility"]["active"]:
+                    enemy.die(playerFeetCoordinates = (pluto.x + pluto.width / 2, pluto.y + pluto.height - 10))
+
+                else:
+                    pluto.die()
+
+        # Handle power-up collision with pluto
+        for platform in nearby_platforms:
+            powerup = platform.powerup
+
+            if powerup and powerup.collidedWith(pluto):
+                powerup.applyEffect(self.dynamic, self.frame_rate)
+                self.powerups_collected += 1
+
+                # Move power-up out of the screen so it's deleted by removeOffScreenObjects method
+                powerup.y = WINDOW_HEIGHT * 2
+                platform.powerup = None
+
+    # Method to fill the platforms, enemies and power-ups lists with respective instances
+    def createObjects(self):
+        CAMERA_UPPER_BOUND = -self.pluto.camera_y_offset
+
+        last_platform_y_position = self.platforms[-1].y if self.platforms else WINDOW_HEIGHT - PADDING
+
+        # Create a new platform if no platforms have been created or if the last platform created is already on the screen
+        if not self.platforms or last_platform_y_position > CAMERA_UPPER_BOUND:
+            self.spawnPlatform(last_platform_y_position - PLATFORM_GAP)
+
+    # Method to add a platform at the top of the level, with the enemy or power-up placed on it
+    def spawnPlatform(self, y):
+        possible_x_values = [PADDING, WINDOW_WIDTH - PADDING]
+        platform_instance = self.platform_pool.acquire(self.images["platform"], possible_x_values, y, currentScore = self.dynamic["score"], rng = self.level_random, difficulty = self.difficulty)
+
+        self.addEntity(self.platforms, platform_instance)
+
+        # Add an enemy if needed
+        if platform_instance.hasEnemy:
+            possible_x_values = [platform_instance.x, platform_instance.x + platform_instance.width]
+            y_position = platform_instance.hitbox.y + PLATFORM_CENTER_OFFSET
+            enemy_instance = self.enemy_pool.acquire(self.images["enemy"], possible_x_values, y_position, self.sounds, rng = self.entity_random)
+
+            self.addEntity(self.enemies, enemy_instance)
+            platform_instance.enemy = enemy_instance
+            enemy_instance.host = platform_instance
+
+        # Add a power-up if needed
+        elif platform_instance.hasPowerUp:
+            possible_x_values = [platform_instance.x, platform_instance.x + platform_instance.width]
+            y_position = platform_instance.hitbox.y + PLATFORM_CENTER_OFFSET * 1.5
+            powerup_instance = self.powerup_pool.acquire(self.images["powerup"], possible_x_values, y_position, self.sounds, rng = self.level_random)
+
+            self.addEntity(self.powerups, powerup_instance)
+            platform_instance.powerup = powerup_instance
+
+    # Method to put a new object at the top of its list
+    def addEntity(self, entities, entity):
+        entities.append(entity)
+        self.savePreviousPosition(entity)
+
+    # Method to hand an object that left the world back to its pool
+    def releaseEntity(self, pool, entity):
+        # A recycled enemy is placed on another platform, the one it leaves must not point to it anymore
+        if pool is self.enemy_pool:
+            entity.leaveHost()
+
+        pool.release(entity)
+
+    # Returns the platforms close enough to touch a hitbox that spans from "top" to "bottom"
+    def platformsNear(self, top, bottom):
+        return self.platformsBetween(top - COLLISION_MARGIN, bottom + COLLISION_MARGIN)
+
+    # Returns the platforms whose y-coordinate is between "top" and "bottom", from the lowest to the highest
+    def platformsBetween(self, top, bottom):
+        # Platforms are created upwards, so the list is sorted by decreasing y-coordinate
+        start = bisect_left(self.platforms, -bottom, key = lambda platform: -platform.y)
+        end = bisect_right(self.platforms, -top, key = lambda platform: -platform.y)
+
+        return list(islice(self.platforms, start, end))
+
+    # Method to store the current positions so the renderer can interpolate between two steps
+    def savePreviousState(self):
+        self.previous_camera_y_offset = self.pluto.camera_y_offset
+
+        self.savePreviousPosition(self.pluto)
+
+        for entities in (self.platforms, self.enemies, self.powerups):
+            for entity in entities:
+                self.savePreviousPosition(entity)
+
+    # Method to store a single object's position
+    def savePreviousPosition(self, entity):
+        entity.previous_x = entity.x
+        entity.previous_y = entity.y
+
+    # Method to remove the objects that have gone off-screen
+    def removeOffScreenObjects(self):
+        CAMERA_LOWER_BOUND = WINDOW_HEIGHT - self.pluto.camera_y_offset
+
+        self.releaseBottomObjects(CAMERA_LOWER_BOUND)
+
+    # Method to recycle the platforms, enemies, and power-ups at the bottom whose y-coordinate is below "lowerBound"
+    def releaseBottomObjects(self, lowerBound):
+        for entities, pool in ((self.platforms, self.platform_pool), (self.enemies, self.enemy_pool), (self.powerups, self.powerup_pool)):
+            # Objects are created upwards, so the first one still inside the camera keeps everything above it
+            # Dead enemies and collected power-ups are moved far below the screen, so they are never drawn while they wait
+            while entities and entities[0].y >= lowerBound:
+                self.releaseEntity(pool, entities.popleft())
+
+    # Method to handle power-up effects
+    def handlePowerups(self):
+        for powerup in self.dynamic.values():
+            if isinstance(powerup, dict):
+                # Decrement the timer if necessary
+                powerup['timer'] = max(0, powerup['timer'] - 1)
+
+                # Set the active property based on the time left on the timer
+                powerup['active'] = powerup['timer'] > 0
+
+    # Returns how the game ended: "enemy" if pluto was hit before falling, "fell" otherwise - None while it goes on
+    def causeOfDeath(self):
+        if not self.is_over:
+            return None
+
+        return "fell" if self.pluto.is_alive else "enemy"
+
+    # Method to check if the player has lost
+    def playerFell(self):
+        pluto = self.pluto
+
+        # A number that allows enough room below the screen so pluto can completely disappear before touching the trigger
+        GAME_OVER_Y_POSITION = WINDOW_HEIGHT + pluto.height * 1.5 - pluto.camera_y_offset
+
+        # An object placed just below the visible screen
+        game_over_rect = pygame.Rect(-WINDOW_WIDTH, GAME_OVER_Y_POSITION, WINDOW_WIDTH * 3, 1)
+
+        # Return True if pluto touches the trigger
+        return pluto.hitbox.colliderect(game_over_rect)
@@ -1,26 +1,57 @@
 import pygame
 import random
 
+DIRECTIONS = (-1, 1) # 1 for right, -1 for left
+
+# Difficulty curve - A platform gets an enemy in one of "enemy_chance" times, minus one for every "enemy_score_step" points
+# scored, but never less than "enemy_min_chance" (same for power-ups) - One in "moving_chance" platforms moves
+DEFAULT_DIFFICULTY = {
+    "enemy_chance": 4,
+    "enemy_score_step": 200 / 3, # 1.2 is reached at 186 points: at 200 there is an enemy on (almost) every platform
+    "enemy_min_chance": 1.2,
+    "powerup_chance": 5,
+    "powerup_score_step": 200 / 4,
+    "powerup_min_chance": 1.2,
+    "moving_chance": 10,
+}
+
 class Platform:
+    # Fixed set of attributes: no per-instance dictionary
+    __slots__ = (
+        "rng", "type", "platform_sprite", "sprite_rect", "width", "height", "min_x_value", "max_x_value", "x", "y",
+        "previous_x", "previous_y", "touched", "hasChangedScore", "hasEnemy", "hasPowerUp", "enemy", "powerup",
+        "speed", "direction", "hitbox",
+    )
+
     # Constructor for Platform class
-    def __init__(self, sprite, possibleXValues, y, currentScore = 0):           
+    def __init__(self, sprite, possibleXValues, y, currentScore = 0, rng = random, difficulty = DEFAULT_DIFFICULTY):
+        # Rectangles are only created once, recycled platforms reuse them
+        self.sprite_rect = pygame.Rect(0, 0, 0, 0)
+        self.hitbox = pygame.Rect(0, 0, 0, 0)
+
+        self.spawn(sprite, possibleXValues, y, currentScore, rng, difficulty)
+
+    # Method to (re)initialize the platform - Called by the constructor and when the platform is recycled
+    def spawn(self, sprite, possibleXValues, y, currentScore = 0, rng = random, difficulty = DEFAULT_DIFFICULTY):
+        # Random number generator used to build the level
+        self.rng = rng
+
         # Set platform type
-        self.type = self.determinePlatformType()
+        self.type = self.determinePlatformType(difficulty)
         
         # Load sprite
         self.platform_sprite = sprite
 
-        # Initialize sprite rectangle
-        self.sprite_rect = self.platform_sprite.get_rect(y = -500) # -500 to make sure the platform appears out of the screen
-
         # Platform's dimensions
-        self.width = self.sprite_rect.width
-        self.height = self.sprite_rect.height
+        self.width, self.height = self.platform_sprite.get_size()
+
+        # Initialize sprite rectangle
+        self.sprite_rect.update(0, -500, self.width, self.height) # -500 to make sure the platform appears out of the screen
         
         # Platform's initial coordinates
         self.min_x_value = possibleXValues[0]
         self.max_x_value = possibleXValues[1] - self.width
-        self.x = random.randint(self.min_x_value, self.max_x_value)
+        self.x = self.rng.randint(self.min_x_value, self.max_x_value)
         self.y = y
 
         # Platform's state
@@ -29,36 +60,40 @@ class Platform:
         self.hasEnemy = False
         self.hasPowerUp = False
 
+        # Objects placed on the platform
+        self.enemy = None
+        self.powerup = None
+
         # Movement controls
-        self.speed = random.random() * 2
-        self.direction = random.choice([-1, 1])  # 1 for right, -1 for left
+        self.speed = self.rng.random() * 2
+        self.direction = self.rng.choice(DIRECTIONS)
 
-        # Place an enemy: Chances increase as score does - At 200 there is an enemy on (almost) every platform
-        if self.oneInXChances(max(4 - currentScore / (200 / 3), 1.2)) and self.type == "normal":
+        # Place an enemy: Chances increase as score does
+        if self.oneInXChances(max(difficulty["enemy_chance"] - currentScore / difficulty["enemy_score_step"], difficulty["enemy_min_chance"])) and self.type == "normal":
             self.hasEnemy = True
 
         # Place a power-up: Chances increase as score does - Enemies still have priority over power-ups    
-        elif self.oneInXChances(max(5 - currentScore / (200 / 4), 1.2)) and self.type == "normal":
+        elif self.oneInXChances(max(difficulty["powerup_chance"] - currentScore / difficulty["powerup_score_step"], difficulty["powerup_min_chance"])) and self.type == "normal":
             self.hasPowerUp = True
 
         # Initialize platform's hitbox
-        self.hitbox = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.hitbox.update(self.x, self.y, self.width, self.height)
 
     # Method that gets called every frame
-    def tick(self, player, frameRateFactor):
+    def tick(self, player, frameRateFactor = 1):
         self.updateHitbox()
         
         if self.type == "moving":
             self.movePlatform(player, frameRateFactor)
 
     # Method to determine platform's type
-    def determinePlatformType(self):
-        # Create a moving platform: 10% chance
-        return "moving" if self.oneInXChances(10) else "normal"
+    def determinePlatformType(self, difficulty = DEFAULT_DIFFICULTY):
+        # Create a moving platform: 10% chance by default
+        return "moving" if self.oneInXChances(difficulty["moving_chance"]) else "normal"
 
     # There is one in {argument} chances the method returns True
     def oneInXChances(self, x):
-        return random.randint(1, 100) <= 100 / x
+        return self.rng.randint(1, 100) <= 100 / x
 
     # Method to update platform's hitbox
     def updateHitbox(self):
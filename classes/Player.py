@@ -14,8 +14,8 @@ JUMPING_STRENGTH = 50
 CAMERA_FOLLOW_OFFSET = SCREEN_BOTTOM - 300  # Position where the camera will place pluto when moving
 
 class Player:
-    # Constructor for Player class
-    def __init__(self, sprites, sounds):
+    # Constructor for Player class - "deadSprites" are the same sprites upside down, shared by every player
+    def __init__(self, sprites, sounds, deadSprites):
         self.is_alive = True
         
         # Player's coordinates
@@ -42,6 +42,7 @@ class Player:
         self.sprites_right = sprites["right"]
         self.sprites_left = sprites["left"]
         self.sprites_idle = sprites["idle"]
+        self.dead_sprites = deadSprites
 
         # Player's state
         self.current_direction = "idle"
@@ -207,7 +208,7 @@ class Player:
             # Reset falling speed
             self.current_falling_speed = 1
 
-            # Rotate images 180 degrees and store them back to be used in rendering
-            self.sprites_idle = [pygame.transform.rotate(img, 180) for img in self.sprites_idle]    
-            self.sprites_right = [pygame.transform.rotate(img, 180) for img in self.sprites_right]
-            self.sprites_left = [pygame.transform.rotate(img, 180) for img in self.sprites_left]
\ No newline at end of file
+            # Switch to the upside-down sprites, they were already rotated when the images were loaded
+            self.sprites_idle = self.dead_sprites["idle"]
+            self.sprites_right = self.dead_sprites["right"]
+            self.sprites_left = self.dead_sprites["left"]
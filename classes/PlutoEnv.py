@@ -0,0 +1,169 @@
+import pygame
+import random
+import numpy as np
+
+from classes.Assets import Assets
+from classes.GameWorld import INPUT_NAMES, NORMAL_FRAME_RATE, WINDOW_WIDTH, WINDOW_HEIGHT, worldClass
+from classes.Renderer import Renderer
+from classes.FontManager import FontManager
+
+FONT_FAMILY = "calibri, helvetica, arial"
+
+# Every action is a set of pressed keys
+ACTIONS = (
+    (), # Idle
+    ("left",),
+    ("right",),
+    ("jump",),
+    ("jump", "left"),
+    ("jump", "right"),
+)
+
+# Objects described in the feature vector, nearest to pluto first - Missing ones are all zeros
+NEAREST_PLATFORMS = 4
+NEAREST_ENEMIES = 2
+NEAREST_POWERUPS = 2
+
+PLUTO_FEATURES = 9 # Position, velocity, surface and jump state, active power-ups
+PLATFORM_FEATURES = 6 # Present, offset, moving, has a live enemy, touched
+ENEMY_FEATURES = 5 # Present, offset, alive, velocity
+POWERUP_FEATURES = 6 # Present, offset, type
+POWERUP_TYPES = ("invincibility", "double_points", "score_boost")
+
+FEATURE_COUNT = PLUTO_FEATURES + NEAREST_PLATFORMS * PLATFORM_FEATURES + NEAREST_ENEMIES * ENEMY_FEATURES + NEAREST_POWERUPS * POWERUP_FEATURES
+
+MAX_SPEED = 40 # Scale of the velocities, pluto's maximum falling speed
+PIXEL_STRIDE = 4 # Pixel observations keep one pixel out of 4 per axis
+MAX_EPISODE_FRAMES = NORMAL_FRAME_RATE * 60 * 5 # Episodes are truncated after 5 minutes of game time
+
+# Function to load the images a world needs, without a display
+def loadImages():
+    pygame.init()
+
+    return Assets(loadSounds = False).images
+
+# Returns the shape of the observations of an environment
+def observationShape(observation = "features", pixelStride = PIXEL_STRIDE):
+    if observation == "pixels":
+        return (len(range(0, WINDOW_HEIGHT, pixelStride)), len(range(0, WINDOW_WIDTH, pixelStride)), 3)
+
+    return (FEATURE_COUNT,)
+
+# Returns the offset between the centers of an entity and pluto, scaled to the screen
+def offsetFromPluto(entity, pluto):
+    return ((entity.x + entity.width / 2 - pluto.x - pluto.width / 2) / WINDOW_WIDTH,
+            (entity.y + entity.height / 2 - pluto.y - pluto.height / 2) / WINDOW_HEIGHT)
+
+# Returns the entities nearest to pluto, nearest first
+def nearest(entities, pluto, count):
+    return sorted(entities, key = lambda entity: abs(entity.x - pluto.x) + abs(entity.y - pluto.y))[:count]
+
+class PlutoEnv:
+    # Constructor for PlutoEnv class - A Gym-style environment where the agent presses keys and is rewarded with points
+    # "observation" is "features" for a vector describing the world, or "pixels" for the screen, one pixel out of "pixelStride" per axis
+    def __init__(self, images = None, observation = "features", pixelStride = PIXEL_STRIDE, frameSkip = 1, maxFrames = MAX_EPISODE_FRAMES, backend = "objects"):
+        self.images = images if images is not None else loadImages()
+        self.observation = observation
+        self.pixel_stride = pixelStride
+        self.frame_skip = frameSkip
+        self.max_frames = maxFrames
+
+        self.world = worldClass(backend)(self.images)
+        self.action_count = len(ACTIONS)
+        self.observation_shape = observationShape(observation, pixelStride)
+        self.actions = [{name: name in keys for name in INPUT_NAMES} for keys in ACTIONS]
+
+        # The screen is drawn off-screen, only when pixels are observed
+        self.surface = None
+        self.renderer = None
+
+        if observation == "pixels":
+            self.surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            self.renderer = Renderer(self.surface, self.images, FontManager(FONT_FAMILY).get(25, bold = True))
+
+    # Method to start a new episode - Returns the first observation and an info dictionary
+    def reset(self, seed = None):
+        self.world.reset(seed if seed is not None else random.randrange(2 ** 32))
+
+        if self.renderer:
+            self.renderer.target_background_y_position = "start"
+            self.renderer.invalidate()
+
+        return self.observe(), self.info()
+
+    # Method to play one action for "frameSkip" frames - Returns the observation, the reward, whether the game is over,
+    # whether the episode was cut short, and an info dictionary
+    def step(self, action):
+        world = self.world
+        inputs = self.actions[action]
+        score = world.dynamic["score"]
+        terminated = False
+
+        for _ in range(self.frame_skip):
+            if not world.step(inputs):
+                terminated = True
+                break
+
+        truncated = not terminated and world.frame_count >= self.max_frames
+
+        return self.observe(), float(world.dynamic["score"] - score), terminated, truncated, self.info()
+
+    # Returns the observation of the current frame
+    def observe(self):
+        return self.pixels() if self.observation == "pixels" else self.featureVector()
+
+    # Returns information about the episode that isn't part of the observation
+    def info(self):
+        return {"score": self.world.dynamic["score"], "frame": self.world.frame_count, "seed": self.world.seed}
+
+    # Returns the feature vector: pluto's state, then the nearest platforms, enemies and power-ups relative to pluto
+    def featureVector(self):
+        world = self.world
+        pluto = world.pluto
+        dynamic = world.dynamic
+        features = np.zeros(FEATURE_COUNT, dtype = np.float32)
+
+        features[0:PLUTO_FEATURES] = (
+            pluto.x / WINDOW_WIDTH,
+            (pluto.y + pluto.camera_y_offset) / WINDOW_HEIGHT,
+            (pluto.x - pluto.previous_x) / MAX_SPEED,
+            (pluto.y - pluto.previous_y) / MAX_SPEED,
+            pluto.is_on_surface,
+            pluto.is_jumping,
+            dynamic["invincibility"]["active"],
+            dynamic["double_points"]["active"],
+            dynamic["score_boost"]["active"],
+        )
+        i = PLUTO_FEATURES
+
+        for platform in nearest(world.platforms, pluto, NEAREST_PLATFORMS):
+            features[i:i + PLATFORM_FEATURES] = (1, *offsetFromPluto(platform, pluto), platform.type == "moving", platform.enemy is not None and platform.enemy.is_alive, platform.touched)
+            i += PLATFORM_FEATURES
+
+        i = PLUTO_FEATURES + NEAREST_PLATFORMS * PLATFORM_FEATURES
+
+        for enemy in nearest(world.enemies, pluto, NEAREST_ENEMIES):
+            features[i:i + ENEMY_FEATURES] = (1, *offsetFromPluto(enemy, pluto), enemy.is_alive, enemy.speed * enemy.direction * enemy.moving_enemy / MAX_SPEED)
+            i += ENEMY_FEATURES
+
+        i = PLUTO_FEATURES + NEAREST_PLATFORMS * PLATFORM_FEATURES + NEAREST_ENEMIES * ENEMY_FEATURES
+
+        # Collected power-ups wait below the screen until they are recycled - Only the ones still on their platform can be taken
+        powerups = [platform.powerup for platform in world.platforms if platform.powerup is not None]
+
+        for powerup in nearest(powerups, pluto, NEAREST_POWERUPS):
+            features[i:i + POWERUP_FEATURES] = (1, *offsetFromPluto(powerup, pluto), *(powerup.type == kind for kind in POWERUP_TYPES))
+            i += POWERUP_FEATURES
+
+        return features
+
+    # Returns the screen as an array of rows of RGB pixels, keeping one pixel out of "pixelStride" per axis
+    def pixels(self):
+        self.renderer.draw(self.world, 0)
+
+        # pixels3d reads the surface's memory directly, only the kept pixels are copied
+        view = pygame.surfarray.pixels3d(self.surface)
+        observation = view[::self.pixel_stride, ::self.pixel_stride].transpose(1, 0, 2).copy()
+        del view # The surface stays locked while the view exists
+
+        return observation
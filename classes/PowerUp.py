@@ -2,8 +2,25 @@ import pygame
 import random
 
 class PowerUp:
+    # Fixed set of attributes: no per-instance dictionary
+    __slots__ = (
+        "rng", "type", "sounds", "powerup_sprite", "sprite_rect", "width", "height", "possible_x_values",
+        "x", "y", "previous_x", "previous_y", "hitbox",
+    )
+
     # Constructor for PowerUp class
-    def __init__(self, powerupImages, possibleXValues, y, sounds):
+    def __init__(self, powerupImages, possibleXValues, y, sounds, rng = random):
+        # Rectangles are only created once, recycled power-ups reuse them
+        self.sprite_rect = pygame.Rect(0, 0, 0, 0)
+        self.hitbox = pygame.Rect(0, 0, 0, 0)
+
+        self.spawn(powerupImages, possibleXValues, y, sounds, rng)
+
+    # Method to (re)initialize the power-up - Called by the constructor and when the power-up is recycled
+    def spawn(self, powerupImages, possibleXValues, y, sounds, rng = random):
+        # Random number generator used to build the level
+        self.rng = rng
+
         # Set power-up's type
         self.type = self.determineType()
         
@@ -13,20 +30,19 @@ class PowerUp:
         # Load appropriate sprite
         self.powerup_sprite = powerupImages[self.type]
 
-        # Initialize sprite rectangle
-        self.sprite_rect = self.powerup_sprite.get_rect(y = -500) # -500 to make sure the power-up appears out of the screen
-
         # Powerup's dimensions
-        self.width = self.sprite_rect.width
-        self.height = self.sprite_rect.height
+        self.width, self.height = self.powerup_sprite.get_size()
+
+        # Initialize sprite rectangle
+        self.sprite_rect.update(0, -500, self.width, self.height) # -500 to make sure the power-up appears out of the screen
 
         # Power-up's coordinates
         self.possible_x_values = possibleXValues
-        self.x = random.randint(possibleXValues[0] + self.width, possibleXValues[1] - self.width)
+        self.x = self.rng.randint(possibleXValues[0] + self.width, possibleXValues[1] - self.width)
         self.y = y - self.height # Subtract height to make sure it is shown on top of the surface it was placed on
 
         # Initialize power-up's hitbox
-        self.hitbox = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.hitbox.update(self.x, self.y, self.width, self.height)
 
     # Method that gets called every frame
     def tick(self):
@@ -65,7 +81,7 @@ class PowerUp:
 
     # Method to determine power-up's type
     def determineType(self):
-        random_number = random.randint(1, 100)
+        random_number = self.rng.randint(1, 100)
 
         # Create an invincibility power-up - 33% chance
         if random_number < 33:
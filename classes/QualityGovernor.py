@@ -0,0 +1,51 @@
+from collections import deque
+
+WINDOW_SIZE = 45 # Frames measured before deciding, 1 second at 45 fps
+DOWNGRADE_LOAD = 0.9 # Part of the frame budget above which effects are turned off
+UPGRADE_LOAD = 0.6 # Part of the frame budget below which effects are turned back on
+UPGRADE_WINDOWS = 3 # Windows in a row with headroom before an effect is turned back on
+
+class QualityGovernor:
+    # Constructor for QualityGovernor class - Chooses a quality level between 0 (everything drawn) and "levelCount - 1"
+    # The level goes up when frames take too much of their budget, and back down after a while with headroom
+    # The gap between the two loads and the longer wait to upgrade keep it from flickering between two levels
+    def __init__(self, levelCount, windowSize = WINDOW_SIZE, downgradeLoad = DOWNGRADE_LOAD, upgradeLoad = UPGRADE_LOAD, upgradeWindows = UPGRADE_WINDOWS):
+        self.level_count = levelCount
+        self.level = 0
+        self.downgrade_load = downgradeLoad
+        self.upgrade_load = upgradeLoad
+        self.upgrade_windows = upgradeWindows
+
+        # Part of the budget used by the last frames - Emptied after every change, so the next decision only sees the new level
+        self.loads = deque(maxlen = windowSize)
+        self.calm_windows = 0
+
+    # Method to measure a frame - "busyTime" is how long the frame worked and "budget" how long it could have
+    # Returns whether the level changed
+    def update(self, busyTime, budget):
+        self.loads.append(busyTime / budget)
+
+        if len(self.loads) < self.loads.maxlen:
+            return False
+
+        # The median ignores single slow frames, like the garbage collector or a new platform's first blit
+        load = sorted(self.loads)[len(self.loads) // 2]
+        self.loads.clear()
+
+        if load > self.downgrade_load and self.level < self.level_count - 1:
+            self.calm_windows = 0
+            self.level += 1
+            return True
+
+        if load < self.upgrade_load and self.level > 0:
+            self.calm_windows += 1
+
+            if self.calm_windows >= self.upgrade_windows:
+                self.calm_windows = 0
+                self.level -= 1
+                return True
+
+            return False
+
+        self.calm_windows = 0
+        return False
@@ -0,0 +1,27 @@
+class RenderQueue:
+    # Constructor for RenderQueue class
+    def __init__(self):
+        # Draw commands of every layer, as (surface, position) pairs in submission order
+        self.layers = {}
+
+    # Method to queue "surface" to be drawn at "position" - Higher layers are drawn on top of lower ones
+    def submit(self, layer, surface, position):
+        commands = self.layers.get(layer)
+
+        if commands is None:
+            commands = self.layers[layer] = []
+
+        commands.append((surface, position))
+
+    # Method to draw every queued command onto "target" with a single Surface.blits call per layer - Returns the rects drawn on
+    def flush(self, target):
+        rects = []
+
+        for layer in sorted(self.layers):
+            commands = self.layers[layer]
+
+            if commands:
+                rects.extend(target.blits(commands))
+                commands.clear()
+
+        return rects
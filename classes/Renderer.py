@@ -0,0 +1,352 @@
+import pygame
+import time
+
+from animations.animateInAndOut import *
+from animations.drawShadow import *
+from classes.EffectCache import EffectCache
+from classes.BackgroundLayer import BackgroundLayer, bakeStarField
+from classes.RenderQueue import RenderQueue
+
+# Constants
+WINDOW_WIDTH = 500
+WINDOW_HEIGHT = 800
+NORMAL_FRAME_RATE = 45
+TRANSITION_STEP = 1 / NORMAL_FRAME_RATE # Seconds of real time for every step of the background's start and end transitions
+MAX_TRANSITION_STEPS = 5 # A slow frame drops time instead of making the transition jump
+
+PLUTO_PERSONAL_SPACE = 15 # Distance between the satellite/power-up cues and pluto's image
+SATELLITE_RADIUS = 10
+MAX_INTERPOLATED_DISTANCE = 100 # Horizontal moves longer than this in a single step are teleports
+
+SCREEN_RECT = pygame.Rect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+STAR_COUNT = 90
+STARS_SCROLL_RATE = 0.25 # Stars are far away, so they move slower than the platforms
+
+# Render queue layers, from the back to the front
+PLATFORMS_LAYER = 0
+SHADOWS_LAYER = 1
+OBJECTS_LAYER = 2
+PLUTO_LAYER = 3
+EFFECTS_LAYER = 4
+HUD_LAYER = 5
+
+# Quality levels, from the best looking to the cheapest - Every level turns off one more effect, the least visible first
+QUALITY_LEVELS = [{"name": "full", "entity_shadows": True, "animated_labels": True, "animated_force_field": True, "clouds": True, "pluto_shadow": True}]
+
+for name, setting in (("no enemy and power-up shadows", "entity_shadows"), ("static labels", "animated_labels"),
+                      ("simple force field", "animated_force_field"), ("no clouds", "clouds"), ("no shadows", "pluto_shadow")):
+    QUALITY_LEVELS.append(dict(QUALITY_LEVELS[-1], name = name, **{setting: False}))
+
+FORCE_FIELD_COLOR = (60, 60, 255)
+FORCE_FIELD_WIDTH = 3 # Width of the ring drawn instead of the force field by the simple force field
+
+# Color RGB codes
+LIGHT_GREEN = (100, 255, 100)
+WHITE = (255, 255, 255)
+
+class Renderer:
+    # Constructor for Renderer class
+    def __init__(self, surface, images, font, fontMargin = 20):
+        self.surface = surface
+        self.font = font
+        self.font_margin = fontMargin
+
+        # Rendered texts, so they are only rasterized again when they change
+        self.text_cache = EffectCache(maxSize = 8)
+
+        # Load images
+        self.background_image = images["background"]
+        self.cloud_image = images["clouds"]
+
+        # Parallax layers drawn over the background, from the farthest to the closest
+        self.stars_layer = BackgroundLayer(bakeStarField(WINDOW_WIDTH, WINDOW_HEIGHT, STAR_COUNT), STARS_SCROLL_RATE, repeat = True)
+        self.clouds_layer = BackgroundLayer(self.cloud_image, 1, baseY = WINDOW_HEIGHT - (self.cloud_image.get_rect().height - 30))
+        self.layers = [self.stars_layer, self.clouds_layer]
+
+        # Draw commands of the current frame, sent to the screen layer by layer
+        self.queue = RenderQueue()
+
+        # Position between the last two simulation steps
+        self.alpha = 1
+
+        # Areas of the screen drawn over the background on the current frame
+        self.drawn_rects = []
+
+        # Optional FrameTimer that measures the phases of every frame
+        self.timer = None
+
+        # Effects that are drawn - See QUALITY_LEVELS
+        self.quality_level = 0
+        self.quality = QUALITY_LEVELS[0]
+
+        # Background scrolling state
+        self.background_y_position = 1
+        self.target_background_y_position = None
+
+        # Start and end transitions move in fixed steps of real time, like the simulation, and are drawn between the last two
+        self.transition_target = None
+        self.transition_time = None
+        self.transition_accumulator = 0
+        self.transition_position = 0
+        self.previous_transition_position = 0
+
+    # Method to draw the whole world - It only reads the world's state
+    # "alpha" is how far rendering is between the previous and the current simulation step (0 to 1)
+    def draw(self, world, highScore, alpha = 1):
+        submit = self.queue.submit
+        timer = self.timer
+        quality = self.quality
+        pluto = world.pluto
+        dynamic = world.dynamic
+        self.alpha = alpha
+        self.drawn_rects = []
+
+        # Interpolated camera position
+        camera_y_offset = self.interpolate(world.previous_camera_y_offset, pluto.camera_y_offset)
+
+        # Draw background and clouds - They cover the whole frame, so they are drawn right away
+        self.drawBackgroundLayers(camera_y_offset)
+
+        if timer: timer.mark("background")
+
+        # Draw platforms
+        for platform in world.platforms:
+            submit(PLATFORMS_LAYER, platform.platform_sprite, self.screenPosition(platform, camera_y_offset))
+
+        # Draw enemies
+        for enemy in world.enemies:
+            x, y = self.screenPosition(enemy, camera_y_offset)
+
+            # Draw shadow under the enemy
+            if quality["entity_shadows"]:
+                submit(SHADOWS_LAYER, *get_shadow(x=x, y=y + enemy.height / 2, width=enemy.width, height=pluto.width / 3))
+
+            # Draw the enemy sprite
+            submit(OBJECTS_LAYER, enemy.current_sprite, (x, y))
+
+        # Draw power-ups
+        for powerup in world.powerups:
+            x, y = self.screenPosition(powerup, camera_y_offset)
+
+            # Draw shadow under the power-ups
+            if quality["entity_shadows"]:
+                submit(SHADOWS_LAYER, *get_shadow(x=x, y=y + powerup.height / 2, width=powerup.width))
+
+            # Draw the power-up sprite
+            submit(OBJECTS_LAYER, powerup.powerup_sprite, (x, y))
+
+        pluto_x, pluto_y = self.screenPosition(pluto, camera_y_offset)
+
+        # Draw pluto's satellite
+        SATELLITE_COLOR = (
+            int(min(dynamic["score"] * 255 / 200, 255)), # Red value: (score:value) 0:0, 200:255
+            int(max(255 - dynamic["score"] * 255 / 200, 0)), # Green value: (score:value) 0:255, 200:0
+            0, # Blue value
+        )
+        submit(PLUTO_LAYER, getCircle(SATELLITE_COLOR, SATELLITE_RADIUS, 255), (pluto_x - SATELLITE_RADIUS, pluto_y - SATELLITE_RADIUS))
+
+        # Draw shadow under the pluto if it's on a platform
+        if pluto.is_on_surface and quality["pluto_shadow"]:
+            submit(SHADOWS_LAYER, *get_shadow(x=pluto_x, y=pluto_y + pluto.height / 1.25, width=pluto.width, height=pluto.width / 3))
+
+        # Draw pluto
+        submit(PLUTO_LAYER, pluto.current_sprites[int(pluto.current_frame)], (pluto_x, pluto_y))
+
+        if timer: timer.mark("sprites")
+
+        # Draw active power-up's visual effect
+        self.drawEffects(world, pluto_x, pluto_y)
+
+        if timer: timer.mark("effects")
+
+        # Display scores
+        self.drawHUD(dynamic["score"], highScore)
+
+        if timer: timer.mark("hud")
+
+        # Send every queued sprite to the screen
+        self.drawn_rects.extend(self.queue.flush(self.surface))
+
+        if timer: timer.mark("blits")
+
+    # Method to choose which effects are drawn, from QUALITY_LEVELS
+    def setQuality(self, level):
+        self.quality_level = level
+        self.quality = QUALITY_LEVELS[level]
+        self.clouds_layer.visible = self.quality["clouds"]
+
+        # The background changes, so the whole screen has to be drawn again
+        self.invalidate()
+
+    # Method to draw an image over the finished frame, like a debug overlay
+    def drawOverlay(self, image, position):
+        self.drawn_rects.append(self.surface.blit(image, position))
+
+    # Method to show the frame that was just drawn
+    def present(self):
+        pygame.display.flip()
+
+    # Method to make sure the next frame is drawn completely - This renderer always draws complete frames
+    def invalidate(self):
+        pass
+
+    # Returns the value between the previous and the current step that corresponds to the current alpha
+    def interpolate(self, previous, current):
+        return previous + (current - previous) * self.alpha
+
+    # Returns where an object has to be drawn on the screen
+    def screenPosition(self, entity, cameraYOffset):
+        x = entity.x
+
+        # Don't interpolate jumps, like pluto going through one side of the screen and appearing on the other
+        if abs(entity.x - entity.previous_x) < MAX_INTERPOLATED_DISTANCE:
+            x = self.interpolate(entity.previous_x, entity.x)
+
+        y = self.interpolate(entity.previous_y, entity.y)
+
+        return round(x), round(y + cameraYOffset)
+
+    # Method to queue the visual effects of the active power-ups
+    def drawEffects(self, world, plutoX, plutoY):
+        submit = self.queue.submit
+        pluto = world.pluto
+        dynamic = world.dynamic
+        quality = self.quality
+        center = (plutoX + pluto.width / 2, plutoY + pluto.height / 2)
+
+        if dynamic["invincibility"]["active"] and quality["animated_force_field"]:
+            # Draw a force field around Pluto
+            submit(EFFECTS_LAYER, *animateCircleInAndOut(colorRGB=FORCE_FIELD_COLOR, center=center, initialRadius=0, maxRadius=pluto.height,
+                               maxAlpha=50, totalDuration=3, timeLeft=dynamic["invincibility"]["timer"] / world.frame_rate, animationDuration=0.2))
+
+        elif dynamic["invincibility"]["active"]:
+            # Draw an opaque ring around Pluto, cheaper than blending a transparent disc
+            ring_surface = getRing(FORCE_FIELD_COLOR, pluto.height, FORCE_FIELD_WIDTH)
+            submit(EFFECTS_LAYER, ring_surface, ring_surface.get_rect(center=center))
+
+        # Without animations the labels are drawn at full size, like the score
+        if not quality["animated_labels"]:
+            label = ("+5", "green") if dynamic["score_boost"]["active"] else ("2x", "chartreuse") if dynamic["double_points"]["active"] else None
+
+            if label:
+                label_surface = self.renderText(*label)
+                submit(EFFECTS_LAYER, label_surface, label_surface.get_rect(center=(plutoX + pluto.width + PLUTO_PERSONAL_SPACE, plutoY)))
+
+        elif dynamic["score_boost"]["active"]:
+            # Draw "+5" next to Pluto
+            submit(EFFECTS_LAYER, *animateTextInAndOut(self.font, text="+5", initialSize=0, maxSize=30, color="green",
+                             center=(plutoX + pluto.width + PLUTO_PERSONAL_SPACE, plutoY), totalDuration=0.8,
+                             timeLeft=dynamic["score_boost"]["timer"] / world.frame_rate, animationDuration=0.2))
+
+        elif dynamic["double_points"]["active"]:
+            # Draw "2x" next to Pluto
+            submit(EFFECTS_LAYER, *animateTextInAndOut(self.font, text = "2x", initialSize=0, maxSize=30, color="chartreuse",
+                             center=(plutoX + pluto.width + PLUTO_PERSONAL_SPACE, plutoY), totalDuration=5,
+                             timeLeft=dynamic["double_points"]["timer"] / world.frame_rate, animationDuration=0.3))
+
+    # Method to queue the current score and the high score
+    def drawHUD(self, score, highScore):
+        submit = self.queue.submit
+
+        # Display current score
+        score_text = f"Score: {score}"
+        score_surface = self.renderText(score_text, WHITE)
+        score_coordinates = (self.font_margin, self.font_margin)
+        submit(HUD_LAYER, score_surface, score_coordinates)
+
+        # Display high score
+        high_score_text = f"High Score: {max(highScore, score)}"
+        high_score_color = WHITE if score <= highScore else LIGHT_GREEN # Change text color if new high score is being set
+        high_score_surface = self.renderText(high_score_text, high_score_color)
+        high_score_text_width = high_score_surface.get_width()
+        high_score_coordinates = (WINDOW_WIDTH - high_score_text_width - self.font_margin, self.font_margin)
+        submit(HUD_LAYER, high_score_surface, high_score_coordinates)
+
+    # Returns the text rendered with the game's font
+    def renderText(self, text, color):
+        return self.text_cache.get((text, color), lambda: self.font.render(text, True, color))
+
+    # Method to draw everything that goes behind the game objects
+    def drawBackgroundLayers(self, cameraYOffset):
+        self.updateBackgroundYPosition(cameraYOffset)
+        self.blitBackgroundLayers(cameraYOffset)
+
+    # Method to copy the background and the parallax layers over an area of the screen
+    def blitBackgroundLayers(self, cameraYOffset, area = SCREEN_RECT):
+        self.blitBackground(area)
+
+        for layer in self.layers:
+            layer.draw(self.surface, cameraYOffset, area)
+
+    # Method to draw the background at its current scrolling position
+    def drawBackground(self, cameraYOffset):
+        self.updateBackgroundYPosition(cameraYOffset)
+        self.blitBackground()
+
+    # Method to copy only the visible window of the tall background image
+    def blitBackground(self, area = SCREEN_RECT):
+        self.surface.blit(self.background_image, area, area.move(0, -round(self.background_y_position)))
+
+    # Method to move the background as the player ascends
+    def updateBackgroundYPosition(self, cameraYOffset):
+        # Calculate the maximum offset the background can move vertically
+        max_offset = -(self.background_image.get_rect().height - WINDOW_HEIGHT)
+
+        # Target background position
+        target = max_offset if self.target_background_y_position == "start" else 0
+
+        # Current background position - The drawn position is between two steps during a transition
+        position = self.background_y_position if self.transition_time is None else self.transition_position
+        if position > 0: position = max_offset
+
+        # Check if the target position has already been achieved
+        target_accomplished = (self.target_background_y_position == None) or (target == position)
+
+        # If the target has not been achieved...
+        if not target_accomplished:
+            now = time.perf_counter()
+
+            # A new transition takes its first step right away
+            if self.transition_time is None or self.transition_target != self.target_background_y_position:
+                self.transition_target = self.target_background_y_position
+                self.transition_accumulator = TRANSITION_STEP
+
+            else:
+                self.transition_accumulator = min(self.transition_accumulator + now - self.transition_time, MAX_TRANSITION_STEPS * TRANSITION_STEP)
+
+            self.transition_time = now
+
+            while self.transition_accumulator >= TRANSITION_STEP:
+                self.transition_accumulator -= TRANSITION_STEP
+                self.previous_transition_position = position
+
+                # Calculate moving speed relative to the difference between the target and current position
+                MOVING_SPEED = -max((target + position) / NORMAL_FRAME_RATE, -2) if target > position else target + position
+
+                # Update the position towards the target, without going out of bound
+                position = max(max_offset, min(0, position + MOVING_SPEED))
+
+            self.transition_position = position
+
+            # Draw between the last two steps - Except when the target is reached, like the jump back to the start
+            if position == target:
+                self.background_y_position = position
+            else:
+                alpha = self.transition_accumulator / TRANSITION_STEP
+                self.background_y_position = self.previous_transition_position + (position - self.previous_transition_position) * alpha
+
+        # If the target has been achieved... (middle-game)
+        else:
+            # Reset the target marker and the transition
+            self.target_background_y_position = None
+            self.transition_time = None
+            self.transition_accumulator = 0
+
+            # Normalize the camera offset to a scale that makes the background movement smoother
+            normalized_camera_offset = cameraYOffset / (45 * WINDOW_HEIGHT) # 45 is an arbitrary number, the background stops moving at a score of ~250
+
+            # Ensure the normalized value stays within the range 0 to 1
+            clamped_value = max(0, min(1, normalized_camera_offset))
+
+            # Assign the background's y-position by scaling the max offset relative to the clamped value
+            self.background_y_position = max_offset * (1 - clamped_value)
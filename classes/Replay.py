@@ -0,0 +1,100 @@
+import struct
+import zlib
+
+from classes.GameWorld import INPUT_NAMES
+
+# File format
+REPLAY_MAGIC = b"PLRP"
+REPLAY_VERSION = 3
+HEADER_FORMAT = "<4sBqHII" # Magic, version, seed, checksum interval, number of frames, number of checksums
+CHECKSUM_FORMAT = "<II" # Frame, CRC32 of the world's state
+SEED_RANGE = range(-2 ** 63, 2 ** 63) # Seeds that fit in the header's signed 64-bit field
+
+CHECKSUM_INTERVAL = 45 # Frames between state checksums (one second at the normal frame rate)
+
+# Function to pack a frame's inputs into a single byte - One bit per input
+def packInputs(inputs):
+    bits = 0
+
+    for i, name in enumerate(INPUT_NAMES):
+        if inputs.get(name):
+            bits |= 1 << i
+
+    return bits
+
+# Function to unpack a byte created by packInputs
+def unpackInputs(bits):
+    return {name: bool(bits & (1 << i)) for i, name in enumerate(INPUT_NAMES)}
+
+# Function to get a checksum of the state that matters for divergence: pluto's position, the score and the number of entities
+def worldChecksum(world):
+    entity_count = len(world.platforms) + len(world.enemies) + len(world.powerups)
+    state = struct.pack("<ddiI", world.pluto.x, world.pluto.y, world.dynamic["score"], entity_count)
+
+    return zlib.crc32(state)
+
+class Replay:
+    # Constructor for Replay class
+    def __init__(self, seed, checksumInterval = CHECKSUM_INTERVAL):
+        self.seed = seed
+        self.checksum_interval = checksumInterval
+
+        self.inputs = bytearray()
+        self.checksums = {} # Frame number: checksum
+
+    # Returns the number of recorded frames
+    def __len__(self):
+        return len(self.inputs)
+
+    # Method to call after every recorded step of the world
+    def record(self, world, inputs):
+        self.inputs.append(packInputs(inputs))
+
+        # Store a checksum periodically and on the last frame of the game
+        if world.frame_count % self.checksum_interval == 0 or world.is_over:
+            self.checksums[world.frame_count] = worldChecksum(world)
+
+    # Returns the inputs to feed the world on its next step
+    def inputsFor(self, world):
+        return unpackInputs(self.inputs[world.frame_count])
+
+    # Returns False if the world doesn't match the recording on its current frame
+    def verify(self, world):
+        expected = self.checksums.get(world.frame_count)
+
+        return expected is None or expected == worldChecksum(world)
+
+    # Method to write the replay to a compact binary file
+    def save(self, path):
+        header = struct.pack(HEADER_FORMAT, REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.checksum_interval, len(self.inputs), len(self.checksums))
+        checksums = b"".join(struct.pack(CHECKSUM_FORMAT, frame, checksum) for frame, checksum in sorted(self.checksums.items()))
+
+        try:
+            with open(path, 'wb') as file:
+                file.write(header)
+                file.write(zlib.compress(bytes(self.inputs) + checksums, 9))
+
+        except IOError as error:
+            print(f"Error saving replay to {path}: {error}")
+
+    # Method to read a replay written by save
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        magic, version, seed, checksum_interval, frame_count, checksum_count = struct.unpack(HEADER_FORMAT, data[:header_size])
+
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a version {REPLAY_VERSION} replay file")
+
+        body = zlib.decompress(data[header_size:])
+
+        replay = cls(seed, checksum_interval)
+        replay.inputs = bytearray(body[:frame_count])
+
+        for frame, checksum in struct.iter_unpack(CHECKSUM_FORMAT, body[frame_count:frame_count + checksum_count * struct.calcsize(CHECKSUM_FORMAT)]):
+            replay.checksums[frame] = checksum
+
+        return replay
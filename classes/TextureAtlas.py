@@ -0,0 +1,50 @@
+import pygame
+
+# Constants
+ATLAS_WIDTH = 512
+PADDING = 1 # Empty pixels between sprites so they never bleed into each other
+
+class TextureAtlas:
+    # Constructor for TextureAtlas class - "images" maps a name to a surface
+    def __init__(self, images):
+        self.rects = {}
+
+        # Pack the images and copy them into a single surface
+        width, height = self.pack(images)
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        # BLEND_RGBA_MAX over transparent pixels copies the images exactly, alpha included
+        for name, image in images.items():
+            self.surface.blit(image, self.rects[name], special_flags = pygame.BLEND_RGBA_MAX)
+
+        # Convert the whole atlas once if there is a display to convert to
+        if pygame.display.get_surface():
+            self.surface = self.surface.convert_alpha()
+
+        # Sprites are views of the atlas, so they share its pixels
+        self.sprites = {name: self.surface.subsurface(rect) for name, rect in self.rects.items()}
+
+    # Returns the sprite stored with the given name
+    def get(self, name):
+        return self.sprites[name]
+
+    # Method to place the images in rows (shelves), from tallest to shortest - Returns the atlas size
+    def pack(self, images):
+        x = y = shelf_height = width = 0
+
+        for name, image in sorted(images.items(), key = lambda item: item[1].get_height(), reverse = True):
+            image_width, image_height = image.get_size()
+
+            # Start a new shelf if the image doesn't fit in the current one
+            if x + image_width > ATLAS_WIDTH:
+                x = 0
+                y += shelf_height + PADDING
+                shelf_height = 0
+
+            self.rects[name] = pygame.Rect(x, y, image_width, image_height)
+
+            x += image_width + PADDING
+            shelf_height = max(shelf_height, image_height)
+            width = max(width, x)
+
+        return width, y + shelf_height
@@ -0,0 +1,129 @@
+import random
+import multiprocessing
+import numpy as np
+
+from classes.PlutoEnv import PlutoEnv, ACTIONS, PIXEL_STRIDE, loadImages, observationShape
+
+# Function to play one action in an environment, starting its next episode when this one ends
+# Returns the same values as PlutoEnv.step - The last observation of a finished episode is kept in the info dictionary
+def stepAndReset(env, action, seeds):
+    observation, reward, terminated, truncated, info = env.step(action)
+
+    if terminated or truncated:
+        info["final_observation"] = observation
+        observation, reset_info = env.reset(seeds.randrange(2 ** 32))
+        info["next_seed"] = reset_info["seed"]
+
+    return observation, reward, terminated, truncated, info
+
+# Function to put the results of several environments together, one array per value
+def stackResults(results):
+    observations, rewards, terminated, truncated, infos = zip(*results)
+
+    return np.stack(observations), np.array(rewards, dtype = np.float32), np.array(terminated), np.array(truncated), list(infos)
+
+# Function to start an episode in every environment - Returns their observations and infos
+# Every environment also gets its own random stream for the seeds of its next episodes
+def resetAll(envs, seeds):
+    results = [env.reset(seed) for env, seed in zip(envs, seeds)]
+    streams = [random.Random(info["seed"]) for observation, info in results]
+
+    return np.stack([observation for observation, info in results]), [info for observation, info in results], streams
+
+# Function run by every worker process - Owns some of the environments and plays them when asked
+def workerLoop(connection, count, options):
+    images = loadImages()
+    envs = [PlutoEnv(images, **options) for _ in range(count)]
+    streams = []
+
+    while True:
+        command, data = connection.recv()
+
+        if command == "reset":
+            observations, infos, streams = resetAll(envs, data)
+            connection.send((observations, infos))
+
+        elif command == "step":
+            connection.send(stackResults([stepAndReset(env, action, stream) for env, action, stream in zip(envs, data, streams)]))
+
+        elif command == "close":
+            connection.close()
+            break
+
+class VectorPlutoEnv:
+    # Constructor for VectorPlutoEnv class - Plays "count" independent environments with one call
+    # With "workers" the environments are split between that many processes, otherwise they all run in this one
+    # Other keyword arguments are passed to every PlutoEnv
+    def __init__(self, count, workers = 0, **options):
+        self.count = count
+        self.action_count = len(ACTIONS)
+        self.observation_shape = observationShape(options.get("observation", "features"), options.get("pixelStride", PIXEL_STRIDE))
+
+        # Environments played in this process
+        self.envs = []
+        self.streams = []
+
+        # Connection, process and number of environments of every worker
+        self.workers = []
+
+        if not workers:
+            images = loadImages()
+            self.envs = [PlutoEnv(images, **options) for _ in range(count)]
+            return
+
+        # Environments are spread as evenly as possible
+        for i in range(min(workers, count)):
+            size = count // workers + (i < count % workers)
+
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(target = workerLoop, args = (worker_connection, size, options), daemon = True)
+            process.start()
+            worker_connection.close()
+
+            self.workers.append((connection, process, size))
+
+    # Method to start an episode in every environment - "seed" gives environment i the seed "seed + i"
+    # Returns the observations, one row per environment, and a list of info dictionaries
+    def reset(self, seed = None):
+        seeds = [seed + i if seed is not None else random.randrange(2 ** 32) for i in range(self.count)]
+
+        if not self.workers:
+            observations, infos, self.streams = resetAll(self.envs, seeds)
+            return observations, infos
+
+        start = 0
+
+        for connection, process, size in self.workers:
+            connection.send(("reset", seeds[start:start + size]))
+            start += size
+
+        results = [connection.recv() for connection, process, size in self.workers]
+
+        return np.concatenate([observations for observations, infos in results]), [info for observations, infos in results for info in infos]
+
+    # Method to play one action in every environment - Finished episodes start over right away
+    # Returns arrays of observations, rewards, terminated and truncated flags, and a list of info dictionaries
+    def step(self, actions):
+        if not self.workers:
+            return stackResults([stepAndReset(env, action, stream) for env, action, stream in zip(self.envs, actions, self.streams)])
+
+        # Every worker plays its environments while the others play theirs
+        start = 0
+
+        for connection, process, size in self.workers:
+            connection.send(("step", list(actions[start:start + size])))
+            start += size
+
+        results = [connection.recv() for connection, process, size in self.workers]
+        observations, rewards, terminated, truncated, infos = zip(*results)
+
+        return np.concatenate(observations), np.concatenate(rewards), np.concatenate(terminated), np.concatenate(truncated), [info for batch in infos for info in batch]
+
+    # Method to stop the worker processes
+    def close(self):
+        for connection, process, size in self.workers:
+            connection.send(("close", None))
+            connection.close()
+            process.join()
+
+        self.workers = []
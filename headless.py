@@ -0,0 +1,121 @@
+# Runs the game's simulation without rendering anything, as fast as possible
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# Make sure pygame never opens a window or an audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from classes.Assets import Assets
+from classes.GameWorld import INPUT_NAMES, worldClass
+from classes.Replay import Replay
+
+# Function to get a world that can be simulated without a display
+def createHeadlessWorld(seed = None, backend = "objects"):
+    pygame.init()
+    assets = Assets(loadSounds = False)
+
+    return worldClass(backend)(assets.images, seed = seed)
+
+# Simple bot: always jumps and walks towards the lowest platform it hasn't touched yet
+def botInputs(world):
+    inputs = dict.fromkeys(INPUT_NAMES, False)
+    inputs["jump"] = True
+
+    pluto = world.pluto
+    untouched_platforms = [platform for platform in world.platforms if not platform.touched]
+
+    if untouched_platforms:
+        target = max(untouched_platforms, key = lambda platform: platform.y)
+        target_x = target.x + target.width / 2 - pluto.width / 2
+
+        inputs["left"] = pluto.x > target_x + pluto.speed
+        inputs["right"] = pluto.x < target_x - pluto.speed
+
+    return inputs
+
+# Function to simulate a number of frames, restarting the game whenever pluto falls
+def simulate(world, frames, policy = botInputs):
+    games = 1
+
+    # Every new game gets its own seed, derived from the first one so the whole run is reproducible
+    seeds = random.Random(world.seed)
+
+    for _ in range(frames):
+        if not world.step(policy(world)):
+            world.reset(seeds.randrange(2 ** 32))
+            games += 1
+
+    return games
+
+# Function to play a single game and record it
+def recordGame(world, policy = botInputs):
+    replay = Replay(world.seed)
+    running = True
+
+    while running:
+        inputs = policy(world)
+        running = world.step(inputs)
+        replay.record(world, inputs)
+
+    return replay
+
+# Function to play a replay back as fast as possible - Returns the frame where it diverged, or None
+def verifyReplay(world, replay):
+    world.reset(replay.seed)
+
+    while world.frame_count < len(replay):
+        world.step(replay.inputsFor(world))
+
+        if not replay.verify(world):
+            return world.frame_count
+
+    return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Run Pluto's simulation without a display")
+    parser.add_argument("--frames", type = int, default = 10000, help = "number of frames to simulate")
+    parser.add_argument("--seed", type = int, default = None, help = "seed for the first game")
+    parser.add_argument("--backend", choices = ("objects", "numpy"), default = "objects", help = "how entities are updated: one object at a time or in NumPy arrays")
+    parser.add_argument("--record", metavar = "FILE", default = None, help = "record one game played by the bot and exit")
+    parser.add_argument("--replay", metavar = "FILE", default = None, help = "check a replay file for divergence and exit")
+    args = parser.parse_args()
+
+    world = createHeadlessWorld(args.seed, args.backend)
+
+    if args.record:
+        replay = recordGame(world)
+        replay.save(args.record)
+
+        print(f"Recorded {len(replay)} frames with seed {replay.seed} (score {world.dynamic['score']}) to {args.record}")
+        sys.exit()
+
+    if args.replay:
+        replay = Replay.load(args.replay)
+
+        start = time.perf_counter()
+        diverged_frame = verifyReplay(world, replay)
+        elapsed = time.perf_counter() - start
+
+        if diverged_frame is not None:
+            print(f"Replay diverged at frame {diverged_frame}")
+            sys.exit(1)
+
+        print(f"Replayed {len(replay)} frames in {elapsed:.2f}s without divergence (score {world.dynamic['score']})")
+        sys.exit()
+
+    start = time.perf_counter()
+    games = simulate(world, args.frames)
+    elapsed = time.perf_counter() - start
+
+    print(f"Simulated {args.frames} frames ({games} games) in {elapsed:.2f}s - {args.frames / elapsed:.0f} frames/sec")
+    print(f"Seed: {world.seed} - Last score: {world.dynamic['score']}")
+
+    pygame.quit()
+    sys.exit()
@@ -1,24 +1,61 @@
+import time
+
+STARTUP_TIME = time.perf_counter() # Used to report how long the game takes to start
+
 import pygame
 import sys
+import argparse
 
-from classes.Player import Player
-from classes.Platform import Platform
-from classes.Enemy import Enemy
-from classes.PowerUp import PowerUp
+from classes.Assets import Assets, STATIC_PATH
+from classes.GameWorld import worldClass
+from classes.Renderer import Renderer, QUALITY_LEVELS
+from classes.DirtyRectRenderer import DirtyRectRenderer
+from classes.Replay import Replay, SEED_RANGE
 from classes.Database import Database
 from classes.Button import Button
-
-from animations.animateInAndOut import *
-from animations.drawShadow import *
+from classes.FontManager import FontManager
+from classes.FrameTimer import FrameTimer
+from classes.QualityGovernor import QualityGovernor
 
 # Constants
 WINDOW_WIDTH = 500
 WINDOW_HEIGHT = 800
 NORMAL_FRAME_RATE = 45
+SIMULATION_STEP = 1 / NORMAL_FRAME_RATE # Seconds of game time simulated by every world step
+MAX_STEPS_PER_FRAME = 5 # Slow machines drop time instead of falling further and further behind
+OVERLAY_MARGIN = 10
 
 # Color RGB codes
-LIGHT_GREEN = (100, 255, 100)
 WHITE = (255, 255, 255)
+DARK_BLUE = (4, 14, 29)
+
+# Function to read the --seed option - Seeds that can't be saved in a replay are refused before the game starts
+def seedArgument(text):
+    try:
+        seed = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' is not an integer")
+
+    if seed not in SEED_RANGE:
+        raise argparse.ArgumentTypeError(f"{seed} is outside of {SEED_RANGE.start} to {SEED_RANGE.stop - 1}")
+
+    return seed
+
+# Command line options
+parser = argparse.ArgumentParser(description = "Pluto")
+parser.add_argument("--seed", type = seedArgument, default = None, help = "seed for the level and enemies (every game is played with the same seed)")
+parser.add_argument("--fps", type = int, default = NORMAL_FRAME_RATE, help = "rendering frame rate (the simulation always runs at %(default)s steps per second)")
+parser.add_argument("--backend", choices = ("objects", "numpy"), default = "objects", help = "how entities are updated: one object at a time or in NumPy arrays")
+parser.add_argument("--dirty-rects", action = "store_true", help = "only redraw the parts of the screen that changed")
+parser.add_argument("--record", metavar = "FILE", default = None, help = "record every game's inputs to a replay file (the last game is kept)")
+parser.add_argument("--replay", metavar = "FILE", default = None, help = "play back a replay file instead of reading the keyboard")
+parser.add_argument("--timings", metavar = "FILE", default = None, help = "write how long every phase of every frame takes to a CSV file (F3 shows them on screen)")
+parser.add_argument("--quality", choices = ["auto"] + [str(level) for level in range(len(QUALITY_LEVELS))], default = "auto",
+                    help = f"effects drawn, from 0 (all) to {len(QUALITY_LEVELS) - 1} (fewest) - 'auto' turns effects off when frames are too slow and back on when they are fast again")
+parser.add_argument("--low-latency", action = "store_true",
+                    help = "show the last simulation step instead of smoothing between the last two, and wait for frames by busy looping instead of sleeping (uses a whole core)")
+parser.add_argument("--turbo", type = int, default = 1, help = "replay steps played for every simulation step when playing a replay")
+args = parser.parse_args()
 
 # Initialize Pygame
 pygame.init()
@@ -26,117 +63,131 @@ surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 pygame.display.set_caption("Pluto")
 clock = pygame.time.Clock()
 
-# Initialize Font
-FONT_FAMILY = "calibri, helvetica, arial"
+# Start loading images and sounds on background threads, as early as possible
+assets = Assets(wait = False)
+sounds = assets.sounds # Filled as the sound effects finish loading
+
+# Initialize Font - The manifest's "file" may name a font file in the static folder, so text looks the same on every system
+# No font file is bundled yet: the family is looked up on the system once, falling back to pygame's default font
+font_entry = assets.manifest["font"]
+fonts = FontManager(font_entry["family"], f"{STATIC_PATH}/{font_entry['file']}" if font_entry["file"] else None)
 font_size = 25
 font_margin = 20
-game_font = pygame.font.SysFont(FONT_FAMILY, font_size, bold = True)
-
-# Load images
-load = pygame.image.load
-backgroundPath = "static/images/background"
-characterPath = "static/images/character"
-platformPath = "static/images/platforms"
-enemyPath = "static/images/enemy"
-powerupPath = "static/images/powerups"
-
-background_image = load(f"{backgroundPath}/space.jpg")
-cloud_image = load(f"{backgroundPath}/clouds.png")
-playerImages = {
-    "right": [load(f"{characterPath}/R1Pluto.png"), load(f"{characterPath}/R2Pluto.png"), load(f"{characterPath}/R3Pluto.png"), load(f"{characterPath}/R4Pluto.png")],
-    "left": [load(f"{characterPath}/L1Pluto.png"), load(f"{characterPath}/L2Pluto.png"), load(f"{characterPath}/L3Pluto.png"), load(f"{characterPath}/L4Pluto.png")],
-    "idle": [load(f"{characterPath}/I1Pluto.png"), load(f"{characterPath}/I2Pluto.png"), load(f"{characterPath}/I3Pluto.png"), load(f"{characterPath}/I4Pluto.png")],
-}
-platformImage = load(f"{platformPath}/platform.png")
-enemyImages = {
-    'left': load(f"{enemyPath}/enemyL.png"),
-    'right': load(f"{enemyPath}/enemyR.png"),
-    'idle': load(f"{enemyPath}/spike.png"),
-}
-powerupImages = {
-    'invincibility': load(f"{powerupPath}/invincibility.png"),
-    'double_points': load(f"{powerupPath}/2x.png"),
-    'score_boost': load(f"{powerupPath}/add.png"),
-}
+game_font = fonts.get(font_size, bold = True)
+
+# Function to show the loading progress until every image the game needs is ready
+def displayLoadingScreen():
+    BAR_WIDTH = 300
+    BAR_HEIGHT = 14
+
+    bar_rect = pygame.Rect((WINDOW_WIDTH - BAR_WIDTH) // 2, WINDOW_HEIGHT // 2, BAR_WIDTH, BAR_HEIGHT)
+    loading_surface = game_font.render("Loading...", True, WHITE)
+    loading_rect = loading_surface.get_rect(midbottom = (WINDOW_WIDTH // 2, bar_rect.top - 15))
+
+    while not assets.imagesReady():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+
+        surface.fill(DARK_BLUE)
+        surface.blit(loading_surface, loading_rect)
+
+        # Outline of the bar, filled as the images are decoded
+        progress_rect = bar_rect.inflate(-6, -6)
+        progress_rect.width = int(progress_rect.width * assets.progress())
+
+        pygame.draw.rect(surface, WHITE, bar_rect, 2, border_radius = BAR_HEIGHT // 2)
+        pygame.draw.rect(surface, WHITE, progress_rect, border_radius = progress_rect.height // 2)
+
+        pygame.display.flip()
+        clock.tick(NORMAL_FRAME_RATE)
+
+displayLoadingScreen()
+assets.finishImages()
+assets.convertImages()
 
 # Play music
 try:
-    pygame.mixer.music.load('static/audio/ambient.mp3')
+    pygame.mixer.music.load(f"static/{assets.manifest['music']}")
     pygame.mixer.music.play(-1)
 except Exception as e:
     print(f"Error loading music: {e}")
 
-# Load sounds
-audiosPath = "static/audio"
-sounds = {}
-
-sound_files = {
-    'jump': f"{audiosPath}/jump.mp3",
-    'damage': f"{audiosPath}/damage.mp3",
-    'death': f"{audiosPath}/death.mp3",
-    'enemyDeath': f"{audiosPath}/enemy_death.mp3",
-    'invincibility': f"{audiosPath}/invincibility.mp3",
-    'add': f"{audiosPath}/add.mp3",
-    'double': f"{audiosPath}/2x.mp3"
-}
-
-for key, path in sound_files.items():
-    try:
-        sounds[key] = pygame.mixer.Sound(path)
-    except Exception as e:
-        print(f"Error loading sound '{key}' from {path}: {e}")
-
 # Database instance
 db = Database()
 
-# Player instance
-pluto = Player(playerImages, sounds)
-PLUTO_PERSONAL_SPACE = 15 # Distance between the satellite/power-up cues and pluto's image
+# Simulation and renderer instances
+world = worldClass(args.backend)(assets.images, sounds)
+renderer = (DirtyRectRenderer if args.dirty_rects else Renderer)(surface, assets.images, game_font, font_margin)
+
+# Frame phase timings, shown on screen with F3
+timer = FrameTimer(args.timings, values = ("quality_level",))
+world.timer = timer
+renderer.timer = timer
+overlay_font = fonts.get(14)
+
+# Quality level chosen on the command line, or by the governor from the frame timings
+governor = QualityGovernor(len(QUALITY_LEVELS)) if args.quality == "auto" else None
+
+if not governor:
+    renderer.setQuality(int(args.quality))
+    timer.setValue("quality_level", renderer.quality_level)
 
 # Set window icon to one of pluto's images
-pygame.display.set_icon(pluto.sprites_idle[0])
+pygame.display.set_icon(assets.images["player"]["idle"][0])
 
 # Dictionary to store dynamic variables
 DYNAMIC = {
-    "score": 0,
     "high_score": db.getHighScore(),
-    "invincibility": {
-        "active": False,
-        "timer": 0
-    },
-    "double_points": {
-        "active": False,
-        "timer": 0
-    },
-    "score_boost": {
-        "active": False,
-        "timer": 0
-    },
-    "background_y_position": 1,
-    "target_background_y_position": None
 }
 
 # Dictionary to store game settings
 SETTINGS = {
-    "frame_rate": NORMAL_FRAME_RATE,
-    "mute": False
+    "frame_rate": args.fps,
+    "mute": False,
+    "show_timings": False,
+    "seed": args.seed,
+    "turbo": max(args.turbo, 1)
 }
 
-# Lists with game objects
-PLATFORMS = []
-ENEMIES = []
-POWERUPS = []
+# Replay being recorded or played back
+replay = Replay.load(args.replay) if args.replay else None
+recording = None
+
+# Game states - Every state function runs until the state changes and returns the next state
+PLAYING = "playing"
+GAME_OVER = "game_over"
+EXITING = "exiting"
 
 # Flag to control game state
 running = True
 
-# Function with game's main logic
+# Seconds from launch until the game could be played
+PLAYABLE_TIME = time.perf_counter() - STARTUP_TIME
+
+# Function with game's main logic - Returns the next state once the game is over
 def main():
     global running
     running = True
-    
+
+    # Seconds of real time that haven't been simulated yet - Start with one step so the first frame has something to draw
+    accumulator = SIMULATION_STEP
+    clock.tick()
+    timer.restart()
+
+    score_boost_cheat = False
+
+    # When the keyboard was read for the last simulation step, when it was read before that, and when it was last read
+    input_time = previous_input_time = last_poll_time = time.perf_counter()
+
     # Main loop
     while running:
+        # Wait for the frame's turn first, so the keyboard is read right before the simulation uses it
+        # A busy loop wakes up on time, while sleeping can oversleep by a few milliseconds
+        accumulator += (clock.tick_busy_loop if args.low_latency else clock.tick)(SETTINGS["frame_rate"]) / 1000
+        timer.mark("wait")
+
         # Event loop
         for event in pygame.event.get():
             if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -144,300 +195,161 @@ def main():
 
             # Mute or unmute the game when pressing 'm'
             if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
-                SETTINGS["mute"] = not SETTINGS["mute"]  # Toggle mute state
-                
-                # Adjust music volume
-                pygame.mixer.music.set_volume(0 if SETTINGS["mute"] else 1)
-
-                # Adjust sound effects volume
-                for sound in sounds.values():
-                    sound.set_volume(0 if SETTINGS["mute"] else 1)
+                toggleMute()
 
             # Cheats: Add 5 points when pressing 'o'
             if event.type == pygame.KEYDOWN and event.key == pygame.K_o:
-                DYNAMIC["score"] += 5
-                DYNAMIC["score_boost"]["timer"] = 0.8 * SETTINGS["frame_rate"]
+                score_boost_cheat = True
 
-        # Manage game objects
-        createObjects()
-        removeOffScreenObjects()
+            # Show or hide the frame timings when pressing F3
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                SETTINGS["show_timings"] = not SETTINGS["show_timings"]
 
-        # Manage power-up effects
-        handlePowerups()
+        # Get the keys that are being pressed
+        keys = pygame.key.get_pressed()
+        poll_time = time.perf_counter()
 
-        # Update Player instance every frame
-        pluto.tick(PLATFORMS)
+        # Cheats: 'y' to double frame rate - 't' to halve frame rate (only rendering is affected)
+        SETTINGS["frame_rate"] = (args.fps * 2) if keys[pygame.K_y] else (args.fps / 2) if keys[pygame.K_t] else args.fps
 
-        # Check if the player has fallen off the screen
-        if playerFell(): running = False
+        timer.mark("events")
 
+        # Advance the simulation by as many fixed steps as the elapsed time requires
+        steps = 0
 
-        # Get the keys that are being pressed
-        keys = pygame.key.get_pressed()
-        
-        # Movement controls
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]: 
-            pluto.move(-pluto.speed)
-
-            pluto.current_direction = "left"
-            pluto.current_sprites = pluto.sprites_left
-
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            pluto.move(pluto.speed)
-
-            pluto.current_direction = "right"
-            pluto.current_sprites = pluto.sprites_right
-
-        else:
-            pluto.current_direction = "idle"
-            pluto.current_sprites = pluto.sprites_idle
-
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            pluto.jump()
-
-        # Cheats: 'i' to activate invincibility - 'u' to activate double points
-        if keys[pygame.K_i]: DYNAMIC["invincibility"]["timer"] = 20
-        if keys[pygame.K_u]: DYNAMIC["double_points"]["timer"] = 30
-
-        # Cheats: 'y' to double frame rate - 't' to halve frame rate
-        SETTINGS["frame_rate"] = (NORMAL_FRAME_RATE * 2) if keys[pygame.K_y] else (NORMAL_FRAME_RATE / 2) if keys[pygame.K_t] else NORMAL_FRAME_RATE
-
-
-        # Draw background
-        updateBackgroundYPosition()
-        surface.blit(background_image, (0, DYNAMIC["background_y_position"]))
-
-        # Draw clouds if needed
-        if (pluto.camera_y_offset < WINDOW_HEIGHT):
-            CLOUDS_POSITION = (0, WINDOW_HEIGHT - (cloud_image.get_rect().height - 30) + pluto.camera_y_offset)
-            surface.blit(cloud_image, CLOUDS_POSITION)
-        
-        # Draw platforms
-        for platform in PLATFORMS:
-            surface.blit(platform.platform_sprite, platform.sprite_rect)
-            platform.sprite_rect.update(platform.x, platform.y + pluto.camera_y_offset, platform.width, platform.height)
-
-            # Update Platform instance every frame
-            platform.tick(pluto, frameRateFactor = SETTINGS["frame_rate"] / NORMAL_FRAME_RATE)
-
-            # Increase score if the platform is touched for the first time
-            if platform.touched and not platform.hasChangedScore:
-                DYNAMIC["score"] += 2 if DYNAMIC["double_points"]["active"] else 1
-                platform.hasChangedScore = True
-
-        # Draw enemies
-        for enemy in ENEMIES:
-            # Draw shadow under the enemy
-            draw_shadow(surface, x=enemy.x, y=enemy.y + enemy.height / 2 + pluto.camera_y_offset, width=enemy.width, height=pluto.width / 3)
-            
-            # Draw the enemy sprite
-            surface.blit(enemy.current_sprite, enemy.sprite_rect)
-            enemy.sprite_rect.update(enemy.x, enemy.y + pluto.camera_y_offset, enemy.width, enemy.height)
-
-            # Update Enemy instance every frame
-            enemy.tick(WINDOW_WIDTH, WINDOW_HEIGHT, frameRateFactor = SETTINGS["frame_rate"] / NORMAL_FRAME_RATE)
-
-            # Handle enemy collision with pluto
-            if enemy.collidedWith(pluto):
-                if DYNAMIC["invincibility"]["active"]:
-                    enemy.die(playerFeetCoordinates = (pluto.x + pluto.width / 2, pluto.y + pluto.height - 10))
-
-                else:
-                    pluto.die()
-
-        # Draw power-ups
-        for powerup in POWERUPS:
-            # Draw shadow under the power-ups
-            draw_shadow(surface, x=powerup.x, y=powerup.y + powerup.height / 2 + pluto.camera_y_offset, width=powerup.width)
-
-            # Draw the platform sprite
-            surface.blit(powerup.powerup_sprite, powerup.sprite_rect)
-            powerup.sprite_rect.update(powerup.x, powerup.y + pluto.camera_y_offset, powerup.width, powerup.height)
-
-            # Update Power-Up instance every frame
-            powerup.tick()
-
-            # Handle power-up collision with pluto
-            if powerup.collidedWith(pluto): 
-                powerup.applyEffect(DYNAMIC, SETTINGS["frame_rate"])
-
-                # Move power-up out of the screen so it's deleted by removeOffScreenObjects function
-                powerup.y = WINDOW_HEIGHT * 2
-
-        # Draw pluto's satellite
-        SATELLITE_RADIUS = 10
-        SATELLITE_COLOR = (
-            min(DYNAMIC["score"] * 255 / 200, 255), # Red value: (score:value) 0:0, 200:255
-            max(255 - DYNAMIC["score"] * 255 / 200, 0), # Green value: (score:value) 0:255, 200:0
-            0, # Blue value
-        )
-        pygame.draw.circle(surface, SATELLITE_COLOR, (pluto.x, pluto.y + pluto.camera_y_offset), SATELLITE_RADIUS)
-            
-        # Draw shadow under the pluto if it's on a platform
-        if pluto.is_on_surface:
-            draw_shadow(surface, x=pluto.x, y=pluto.y + pluto.height / 1.25 + pluto.camera_y_offset, width=pluto.width, height=pluto.width / 3)
-
-        # Draw pluto
-        surface.blit(pluto.current_sprites[int(pluto.current_frame)], pluto.sprite_rect)
-        pluto.sprite_rect.update(pluto.x, pluto.y + pluto.camera_y_offset, pluto.width, pluto.height)
-
-        # Draw active power-up's visual effect
-        if DYNAMIC["invincibility"]["active"]:
-            # Draw a force field around Pluto
-            animateCircleInAndOut(surface, colorRGB=(60, 60, 255), center=pluto.sprite_rect.center, initialRadius=0, maxRadius=pluto.height, 
-                               maxAlpha=50, totalDuration=3, timeLeft=DYNAMIC["invincibility"]["timer"] / SETTINGS["frame_rate"], animationDuration=0.2)
-            
-        if DYNAMIC["score_boost"]["active"]:
-            # Draw "+5" next to Pluto
-            animateTextInAndOut(surface, game_font, text="+5", initialSize=0, maxSize=30, color="green",
-                             center=(pluto.x + pluto.width + PLUTO_PERSONAL_SPACE, pluto.y + pluto.camera_y_offset), totalDuration=0.8,
-                             timeLeft=DYNAMIC["score_boost"]["timer"] / SETTINGS["frame_rate"], animationDuration=0.2)
-            
-        elif DYNAMIC["double_points"]["active"]:
-            # Draw "2x" next to Pluto
-            animateTextInAndOut(surface, game_font, text = "2x", initialSize=0, maxSize=30, color="chartreuse",
-                             center=(pluto.x + pluto.width + PLUTO_PERSONAL_SPACE, pluto.y + pluto.camera_y_offset), totalDuration=5,
-                             timeLeft=DYNAMIC["double_points"]["timer"] / SETTINGS["frame_rate"], animationDuration=0.3)
-
-
-        # Display current score
-        score_text = f"Score: {DYNAMIC['score']}"
-        score_surface = game_font.render(score_text, True, WHITE)
-        score_coordinates = (font_margin, font_margin)
-        surface.blit(score_surface, score_coordinates)
-
-        # Display high score
-        high_score_text = f"High Score: {max(DYNAMIC['high_score'], DYNAMIC['score'])}"
-        high_score_color = WHITE if DYNAMIC["score"] <= DYNAMIC["high_score"] else LIGHT_GREEN # Change text color if new high score is being set
-        high_score_surface = game_font.render(high_score_text, True, high_score_color)
-        high_score_text_width = high_score_surface.get_width()
-        high_score_coordinates = (WINDOW_WIDTH - high_score_text_width - font_margin, font_margin)
-        surface.blit(high_score_surface, high_score_coordinates)
-        
+        while running and accumulator >= SIMULATION_STEP and steps < MAX_STEPS_PER_FRAME:
+            running = stepWorld(readInputs(keys, score_boost_cheat))
+            score_boost_cheat = False # The cheat only applies to one step
+
+            accumulator -= SIMULATION_STEP
+            steps += 1
+
+        if steps == MAX_STEPS_PER_FRAME:
+            accumulator = min(accumulator, SIMULATION_STEP)
+
+        # Keys read in a frame without a step are read again before they are used
+        if steps:
+            previous_input_time, input_time = last_poll_time, poll_time
+
+        last_poll_time = poll_time
+
+        # Draw the world between the last two steps - Smoothing shows the last step a bit later, so low latency mode skips it
+        renderer.draw(world, DYNAMIC["high_score"], alpha = 1 if args.low_latency else min(accumulator / SIMULATION_STEP, 1))
+
+        # Draw the frame timings under the score
+        if SETTINGS["show_timings"]:
+            renderer.drawOverlay(timer.overlaySurface(overlay_font), (OVERLAY_MARGIN, font_margin + game_font.get_linesize() + OVERLAY_MARGIN))
+            timer.mark("hud")
 
         # Update the display
-        pygame.display.flip()
+        renderer.present()
+        timer.mark("flip")
 
-        # Set frame rate
-        clock.tick(SETTINGS["frame_rate"])
+        # Time until the last keyboard state used by the simulation is on the screen
+        shown_time = time.perf_counter()
+        timer.measure("input", shown_time - input_time)
+        timer.measure("input_worst", shown_time - previous_input_time)
 
-    # Display end screen
-    displayEndScreen()
+        timer.endFrame()
 
+        # Start using the sound effects that were still loading
+        if not assets.loaded():
+            collectSounds()
 
-# Function to fill the PLATFORMS, ENEMIES and POWERUPS lists with respective instances
-def createObjects():
-    PLATFORM_CENTER_OFFSET = 7
-    PLATFORM_GAP = 200
-    PADDING = 20
-    CAMERA_UPPER_BOUND = -pluto.camera_y_offset
+        # Turn effects off when frames take too long, and back on when they have time to spare
+        if governor and governor.update(timer.busy_time, 1 / SETTINGS["frame_rate"]):
+            renderer.setQuality(governor.level)
+            timer.setValue("quality_level", governor.level)
 
-    last_platform_y_position = PLATFORMS[-1].y if PLATFORMS else WINDOW_HEIGHT - PADDING
-    
-    # Create a new platform if no platforms have been created or if the last platform created is already on the screen
-    if not PLATFORMS or last_platform_y_position > CAMERA_UPPER_BOUND:
-        new_platform_y_position = last_platform_y_position - PLATFORM_GAP
-        possible_x_values = [PADDING, WINDOW_WIDTH - PADDING]
-        platform_instance = Platform(platformImage, possible_x_values, new_platform_y_position, currentScore = DYNAMIC["score"])
-
-        PLATFORMS.append(platform_instance)
-
-        # Add an enemy if needed
-        if platform_instance.hasEnemy:
-            possible_x_values = [platform_instance.x, platform_instance.x + platform_instance.width]
-            y_position = platform_instance.hitbox.y + PLATFORM_CENTER_OFFSET
-            enemy_instance = Enemy(enemyImages, possible_x_values, y_position, sounds)
-            
-            ENEMIES.append(enemy_instance)
-
-        # Add a power-up if needed
-        elif platform_instance.hasPowerUp:
-            possible_x_values = [platform_instance.x, platform_instance.x + platform_instance.width]
-            y_position = platform_instance.hitbox.y + PLATFORM_CENTER_OFFSET * 1.5
-            powerup_instance = PowerUp(powerupImages, possible_x_values, y_position, sounds)
-            
-            POWERUPS.append(powerup_instance)
-
-# Function to remove the platforms that have gone off-screen
-def removeOffScreenObjects():
-    global PLATFORMS, ENEMIES, POWERUPS
-    CAMERA_LOWER_BOUND = WINDOW_HEIGHT - pluto.camera_y_offset
-
-    # Filter out the platforms, enemies, and power-ups whose y-coordinate is below the camera's lower bound
-    PLATFORMS = [platform for platform in PLATFORMS if platform.y < CAMERA_LOWER_BOUND]
-    ENEMIES = [enemy for enemy in ENEMIES if enemy.y < CAMERA_LOWER_BOUND]
-    POWERUPS = [powerup for powerup in POWERUPS if powerup.y < CAMERA_LOWER_BOUND]
-
-# Function to handle power-up effects
-def handlePowerups():
-    for powerup in DYNAMIC.values():
-        if isinstance(powerup, dict):
-            # Decrement the timer if necessary
-            powerup['timer'] = max(0, powerup['timer'] - 1)
-
-            # Set the active property based on the time left on the timer
-            powerup['active'] = powerup['timer'] > 0
-
-# Function to check if the player has lost
-def playerFell():
-    # A number that allows enough room below the screen so pluto can completely disappear before touching the trigger
-    GAME_OVER_Y_POSITION = WINDOW_HEIGHT + pluto.height * 1.5 - pluto.camera_y_offset
-
-    # An object placed just below the visible screen
-    game_over_rect = pygame.Rect(-WINDOW_WIDTH, GAME_OVER_Y_POSITION, WINDOW_WIDTH * 3, 1)
-
-    # Return True if pluto touches the trigger 
-    return pluto.hitbox.colliderect(game_over_rect)
-
-
-# Function to move the background as the player ascends
-def updateBackgroundYPosition():
-    # Calculate the maximum offset the background can move vertically
-    max_offset = -(background_image.get_rect().height - WINDOW_HEIGHT)
-
-    # Target background position
-    target = max_offset if DYNAMIC["target_background_y_position"] == "start" else 0
-
-    # Current background position
-    position = DYNAMIC["background_y_position"]
-    if position > 0: position = max_offset
-
-    # Check if the target position has already been achieved
-    target_accomplished = (DYNAMIC["target_background_y_position"] == None) or (target == position)
-
-    # If the target has not been achieved...
-    if not target_accomplished:
-        # Calculate moving speed relative to the difference between the target and current position
-        MOVING_SPEED = -max((target + position) / NORMAL_FRAME_RATE, -2) if target > position else target + position
-
-        # Update the position towards the target
-        position += MOVING_SPEED
-
-        # Ensure the background y-position does not go out of bound and update it
-        DYNAMIC["background_y_position"] = max(max_offset, min(0, position))
-        
-    # If the target has been achieved... (middle-game)
-    else:
-        # Reset the target marker
-        DYNAMIC["target_background_y_position"] = None
-
-        # Normalize the camera offset to a scale that makes the background movement smoother
-        normalized_camera_offset = pluto.camera_y_offset / (45 * WINDOW_HEIGHT) # 45 is an arbitrary number, the background stops moving at a score of ~250
-
-        # Ensure the normalized value stays within the range 0 to 1
-        clamped_value = max(0, min(1, normalized_camera_offset))
-
-        # Assign the background's y-position by scaling the max offset relative to the clamped value
-        DYNAMIC["background_y_position"] = max_offset * (1 - clamped_value)
-
-
-# Function to display the end screen
+    return GAME_OVER
+
+
+# Function to translate the keyboard state into the simulation's inputs
+def readInputs(keys, scoreBoostCheat = False):
+    return {
+        # Movement controls
+        "left": keys[pygame.K_LEFT] or keys[pygame.K_a],
+        "right": keys[pygame.K_RIGHT] or keys[pygame.K_d],
+        "jump": keys[pygame.K_UP] or keys[pygame.K_w],
+
+        # Cheats: 'i' to activate invincibility - 'u' to activate double points - 'o' to add 5 points
+        "invincibility": keys[pygame.K_i],
+        "double_points": keys[pygame.K_u],
+        "score_boost": scoreBoostCheat,
+    }
+
+# Function to advance the world by one fixed step - Returns False once the game is over
+def stepWorld(inputs):
+    if replay:
+        return playReplayFrames(SETTINGS["turbo"])
+
+    running = world.step(inputs)
+
+    if recording: recording.record(world, inputs)
+
+    return running
+
+# Function to feed recorded inputs to the world - Returns False when the replay ends or diverges
+def playReplayFrames(frames):
+    for _ in range(frames):
+        if world.frame_count >= len(replay):
+            return False
+
+        running = world.step(replay.inputsFor(world))
+
+        if not replay.verify(world):
+            print(f"Replay diverged at frame {world.frame_count}")
+            return False
+
+        if not running:
+            return False
+
+    return True
+
+# Function to write the current recording to disk
+def saveRecording():
+    if recording:
+        recording.save(args.record)
+
+# Function to add the current game to the run history - Replays were already played, so they aren't added again
+def recordRun(causeOfDeath):
+    if not replay:
+        db.recordRun(world.dynamic["score"], world.frame_count / world.frame_rate, world.seed, world.powerups_collected, causeOfDeath)
+
+# Function to add the sound effects that finished loading - Reports the startup time once everything is loaded
+def collectSounds():
+    for key in assets.update():
+        if key in sounds and SETTINGS["mute"]:
+            sounds[key].set_volume(0)
+
+    if assets.loaded():
+        sounds_time = assets.start_time + assets.sounds_time - STARTUP_TIME
+        print(f"Startup: playable after {PLAYABLE_TIME * 1000:.0f} ms (images decoded in {assets.images_time * 1000:.0f} ms), every sound loaded after {sounds_time * 1000:.0f} ms")
+
+# Function to mute or unmute the game
+def toggleMute():
+    SETTINGS["mute"] = not SETTINGS["mute"]  # Toggle mute state
+
+    # Adjust music volume
+    pygame.mixer.music.set_volume(0 if SETTINGS["mute"] else 1)
+
+    # Adjust sound effects volume
+    for sound in sounds.values():
+        sound.set_volume(0 if SETTINGS["mute"] else 1)
+
+
+# Function to display the end screen - Returns the state chosen with the buttons
 def displayEndScreen():
-    global running
-    DYNAMIC["target_background_y_position"] = "end"
+    renderer.target_background_y_position = "end"
     
     # Change high score if necessary
-    DYNAMIC["high_score"] = max(DYNAMIC["score"], DYNAMIC["high_score"])
+    DYNAMIC["high_score"] = max(world.dynamic["score"], DYNAMIC["high_score"])
+
+    # Keep the recording of the game that just ended
+    saveRecording()
+
+    # Save the run right away, so a crash on the end screen doesn't lose it
+    recordRun(world.causeOfDeath())
     
     # Play death sound
     if "death" in sounds:
@@ -448,25 +360,28 @@ def displayEndScreen():
     CONTENT_Y_POSITION = WINDOW_HEIGHT // 2 - 25
 
     # Initialize score text
-    score_text = f"Final Score: {DYNAMIC['score']}"
-    score_font = pygame.font.SysFont(FONT_FAMILY, 37, bold = True)
+    score_text = f"Final Score: {world.dynamic['score']}"
+    score_font = fonts.get(37, bold = True)
     score_surface = score_font.render(score_text, True, WHITE)
     score_rect = score_surface.get_rect(center=(WINDOW_WIDTH // 2, CONTENT_Y_POSITION - GAP))
 
+    # The buttons only pick the next state, the game loop moves to it
+    next_state = []
+
     # Button Instances
     play_again_button = Button(
-            text="Play Again", callback=startGame,
+            text="Play Again", callback=lambda: next_state.append(PLAYING), font=game_font,
             x=WINDOW_WIDTH // 2 - 100, y=CONTENT_Y_POSITION,
             shortcutKeys=[pygame.K_p, pygame.K_s, pygame.K_DOWN]
         )
 
     exit_button = Button(
-            text="Exit Game", callback=exitGame,
+            text="Exit Game", callback=lambda: next_state.append(EXITING), font=game_font,
             x=WINDOW_WIDTH // 2 - 100, y=CONTENT_Y_POSITION + GAP,
             shortcutKeys=[pygame.K_q, pygame.K_e, pygame.K_ESCAPE]
         )
     
-    while not running:
+    while not next_state:
         # Event loop
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -474,18 +389,13 @@ def displayEndScreen():
 
             # Mute or unmute the game when pressing 'm'
             if event.type == pygame.KEYDOWN and event.key == pygame.K_m:
-                SETTINGS["mute"] = not SETTINGS["mute"]  # Toggle mute state
-                
-                # Adjust music volume
-                pygame.mixer.music.set_volume(0 if SETTINGS["mute"] else 1)
+                toggleMute()
 
-                # Adjust sound effects volume
-                for sound in sounds.values():
-                    sound.set_volume(0 if SETTINGS["mute"] else 1)
+            play_again_button.handleEvent(event)
+            exit_button.handleEvent(event)
 
         # Draw the background
-        updateBackgroundYPosition()
-        surface.blit(background_image, (0, DYNAMIC["background_y_position"]))
+        renderer.drawBackground(world.pluto.camera_y_offset)
 
         # Draw the score
         surface.blit(score_surface, score_rect)
@@ -498,33 +408,66 @@ def displayEndScreen():
         pygame.display.flip()
         clock.tick(NORMAL_FRAME_RATE)
 
-# Function to start a new game
+    return next_state[0]
+
+# Function to start a new game - Returns the next state once it's over
 def startGame():
-    # Reset player instance
-    global pluto
-    pluto = Player(playerImages, sounds)
-    
-    # Reset dynamic variables
-    DYNAMIC["score"] = 0
-    DYNAMIC["invincibility"]["timer"] = 0
-    DYNAMIC["double_points"]["timer"] = 0
-    DYNAMIC["score_boost"]["timer"] = 0
-    DYNAMIC["target_background_y_position"] = "start"
-
-    # Reset objects
-    PLATFORMS.clear()
-    ENEMIES.clear()
-    POWERUPS.clear()
+    global recording
+
+    # Reset the simulation
+    world.reset(replay.seed if replay else SETTINGS["seed"])
+
+    # Start recording the new game
+    if args.record and not replay:
+        recording = Replay(world.seed)
+    renderer.target_background_y_position = "start"
+    renderer.invalidate()
 
     # Call main function
-    main()
+    return main()
+
+# Functions run by every state, they all return the state that comes next
+STATES = {
+    PLAYING: startGame,
+    GAME_OVER: displayEndScreen,
+}
+
+# Function to run the game - A flat loop going from state to state, so restarting never piles up calls
+# "games" stops the loop after that many games instead of waiting for the player to exit
+def run(games = None):
+    state = PLAYING
+    started = 0
+
+    while state != EXITING:
+        if state == PLAYING:
+            if started == games:
+                return
+
+            started += 1
+
+        state = STATES[state]()
+
+    exitGame()
 
 # Function to exit the program
 def exitGame():
-    db.setHighScore(max(DYNAMIC["score"], DYNAMIC["high_score"]))
+    saveRecording()
+    timer.close()
+
+    # Report how long the last key presses took to reach the screen
+    if timer.frame_count:
+        average, p95, p99 = timer.statistics("input")
+        print(f"Input to display latency: {average:.1f} ms average, {p95:.1f} ms p95, {p99:.1f} ms p99 - Up to {timer.statistics('input_worst')[2]:.1f} ms with the wait to be read")
+
+    # A game left halfway is a run too
+    if running:
+        recordRun("quit")
+
+    # Wait for the run history to be saved
+    db.close()
     
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    startGame()
\ No newline at end of file
+    run()